@@ -15,25 +15,8 @@ class SerializationMixin(object):
     """Mixin class that adds standard serialization/de-serialiaztion support."""
 
     def __init__(self, *args, **kwargs):
-        self._supports_csv = (False, False)
-        self._csv_sequence = None
-        self._supports_json = (False, False)
-        self._supports_yaml = (False, False)
-        self._supports_dict = (False, False)
-        self._on_serialize = {
-            'csv': None,
-            'json': None,
-            'yaml': None,
-            'dict': None
-        }
-        self._on_deserialize = {
-            'csv': None,
-            'json': None,
-            'yaml': None,
-            'dict': None
-        }
-        self._display_name = None
-
+        # Each setter below assigns the matching private attribute, so there is
+        # no need to pre-populate defaults that would be discarded immediately.
         self.supports_csv = kwargs.pop('supports_csv', (False, False))
         self.csv_sequence = kwargs.pop('csv_sequence', None)
         self.supports_json = kwargs.pop('supports_json', (False, False))
@@ -167,8 +150,7 @@ class SerializationMixin(object):
     def on_serialize(self, value):
         value = callable_to_dict(value)
 
-        for key in value:
-            item = value[key]
+        for key, item in value.items():
             if item is not None and not checkers.is_callable(item):
                 raise SQLAthanorError('on_serialize for %s must be callable' % key)
 
@@ -210,8 +192,7 @@ class SerializationMixin(object):
     def on_deserialize(self, value):
         value = callable_to_dict(value)
 
-        for key in value:
-            item = value[key]
+        for key, item in value.items():
             if item is not None and not checkers.is_callable(item):
                 raise SQLAthanorError('on_deserialize for %s must be callable' % key)
 
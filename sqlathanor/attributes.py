@@ -21,6 +21,24 @@ BLANK_ON_SERIALIZE = {
     'dict': None
 }
 
+# Keys that map onto the attributes of :class:`AttributeConfiguration` itself,
+# in the order returned by :meth:`AttributeConfiguration.keys`.
+_CONFIG_KEYS = ('name',
+                'supports_csv',
+                'supports_json',
+                'supports_yaml',
+                'supports_dict',
+                'csv_sequence',
+                'on_serialize',
+                'on_deserialize',
+                'display_name')
+_CONFIG_KEY_SET = frozenset(_CONFIG_KEYS)
+_SUPPORTS_KEYS = frozenset(['supports_csv',
+                            'supports_json',
+                            'supports_yaml',
+                            'supports_dict'])
+_CALLABLE_KEYS = frozenset(['on_serialize', 'on_deserialize'])
+
 
 class AttributeConfiguration(SerializationMixin):
     """Serialization/de-serialization configuration of a :term:`model attribute`.
@@ -230,15 +248,7 @@ class AttributeConfiguration(SerializationMixin):
         return not self.__eq__(other)
 
     def __getitem__(self, key):
-        if key in ['name',
-                   'supports_csv',
-                   'supports_json',
-                   'supports_yaml',
-                   'supports_dict',
-                   'csv_sequence',
-                   'on_serialize',
-                   'on_deserialize',
-                   'display_name']:
+        if key in _CONFIG_KEY_SET:
             return getattr(self, key)
 
         return self._dict_proxy[key]
@@ -247,31 +257,16 @@ class AttributeConfiguration(SerializationMixin):
         raise KeyError(key)
 
     def __setitem__(self, key, value):
-        if key in ['name',
-                   'supports_csv',
-                   'supports_json',
-                   'supports_yaml',
-                   'supports_dict',
-                   'csv_sequence',
-                   'on_serialize',
-                   'on_deserialize',
-                   'display_name']:
+        if key in _CONFIG_KEY_SET:
             setattr(self, key, value)
         else:
             self._dict_proxy[key] = value
 
     def __delitem__(self, key):
-        if key in ['name',
-                   'csv_sequence',
-                   'on_serialize',
-                   'on_deserialize',
-                   'display_name']:
-            setattr(self, key, None)
-        elif key in ['supports_csv',
-                     'supports_json',
-                     'supports_yaml',
-                     'supports_dict']:
+        if key in _SUPPORTS_KEYS:
             setattr(self, key, (False, False))
+        elif key in _CONFIG_KEY_SET:
+            setattr(self, key, None)
         else:
             self._dict_proxy.__delitem__(key)
 
@@ -285,15 +280,7 @@ class AttributeConfiguration(SerializationMixin):
                 raise error
 
     def __contains__(self, item):
-        if item in ['name',
-                    'supports_csv',
-                    'supports_json',
-                    'supports_yaml',
-                    'supports_dict',
-                    'csv_sequence',
-                    'on_serialize',
-                    'on_deserialize',
-                    'display_name']:
+        if item in _CONFIG_KEY_SET:
             return True
 
         return item in self._dict_proxy
@@ -348,15 +335,7 @@ class AttributeConfiguration(SerializationMixin):
         return self[key] or default
 
     def keys(self):
-        return_value = ['name',
-                        'supports_csv',
-                        'supports_json',
-                        'supports_yaml',
-                        'supports_dict',
-                        'csv_sequence',
-                        'on_serialize',
-                        'on_deserialize',
-                        'display_name']
+        return_value = list(_CONFIG_KEYS)
         return_value.extend(sorted(self._dict_proxy.keys()))
         return return_value
 
@@ -365,18 +344,12 @@ class AttributeConfiguration(SerializationMixin):
             raise KeyError(key)
 
         return_value = self[key] or default
-        if key in ['name',
-                   'csv_sequence',
-                   'display_name']:
-            self[key] = None
-        elif key in ['on_serialize',
-                     'on_deserialize']:
+        if key in _CALLABLE_KEYS:
             self[key] = BLANK_ON_SERIALIZE
-        elif key in ['supports_csv',
-                     'supports_json',
-                     'supports_yaml',
-                     'supports_dict']:
+        elif key in _SUPPORTS_KEYS:
             self[key] = (False, False)
+        elif key in _CONFIG_KEY_SET:
+            self[key] = None
         else:
             return_value = self._dict_proxy.pop(key, default = default)
 
@@ -410,16 +383,26 @@ class AttributeConfiguration(SerializationMixin):
         return cls(attribute = attribute)
 
     def copy(self):
-        new_instance = self.__class__()
-        new_instance.name = self.name
-        new_instance.supports_csv = self.supports_csv
-        new_instance.csv_sequence = self.csv_sequence
-        new_instance.supports_json = self.supports_json
-        new_instance.supports_yaml = self.supports_yaml
-        new_instance.supports_dict = self.supports_dict
-        new_instance.on_serialize = self.on_serialize
-        new_instance.on_deserialize = self.on_deserialize
-        new_instance.display_name = self.display_name
+        """Return a copy of the configuration.
+
+        The values held by ``self`` have already been validated by their property
+        setters, so they are assigned directly rather than validated again.
+
+        :rtype: :class:`AttributeConfiguration`
+        """
+        # pylint: disable=protected-access,attribute-defined-outside-init
+        new_instance = self.__class__.__new__(self.__class__)
+        new_instance._dict_proxy = {}
+        new_instance._current = -1
+        new_instance._name = self._name
+        new_instance._supports_csv = self._supports_csv
+        new_instance._csv_sequence = self._csv_sequence
+        new_instance._supports_json = self._supports_json
+        new_instance._supports_yaml = self._supports_yaml
+        new_instance._supports_dict = self._supports_dict
+        new_instance._on_serialize = dict(self._on_serialize)
+        new_instance._on_deserialize = dict(self._on_deserialize)
+        new_instance._display_name = self._display_name
 
         return new_instance
 
@@ -6,7 +6,6 @@
 # there as needed.
 
 import inspect as inspect_
-from collections import OrderedDict
 
 from sqlalchemy.inspection import inspect
 from sqlalchemy.exc import InvalidRequestError
@@ -19,6 +18,45 @@ from sqlathanor.attributes import AttributeConfiguration, validate_serialization
 from sqlathanor.errors import ConfigurationError, UnsupportedSerializationError
 
 
+def _get_support_filters(from_csv = None,
+                         to_csv = None,
+                         from_json = None,
+                         to_json = None,
+                         from_yaml = None,
+                         to_yaml = None,
+                         from_dict = None,
+                         to_dict = None):
+    """Return the ``(supports_<format> attribute, inbound, outbound)`` filters
+    implied by the ``from_<format>`` / ``to_<format>`` arguments, in format order.
+
+    ``inbound`` / ``outbound`` are :obj:`None <python:None>` where the corresponding
+    argument is :obj:`None <python:None>` (i.e. does not constrain the filter).
+    Formats with neither argument supplied are omitted.
+    """
+    filters = []
+    for support_key, inbound, outbound in (('supports_csv', from_csv, to_csv),
+                                           ('supports_json', from_json, to_json),
+                                           ('supports_yaml', from_yaml, to_yaml),
+                                           ('supports_dict', from_dict, to_dict)):
+        if inbound is None and outbound is None:
+            continue
+        filters.append((support_key,
+                        None if inbound is None else bool(inbound),
+                        None if outbound is None else bool(outbound)))
+
+    return filters
+
+
+def _matches_support_filter(config, support_filter):
+    """Indicate whether ``config`` satisfies a filter returned by
+    :func:`_get_support_filters`."""
+    support_key, inbound, outbound = support_filter
+    support = getattr(config, support_key)
+
+    return (inbound is None or support[0] == inbound) and \
+           (outbound is None or support[1] == outbound)
+
+
 class ConfigurationMixin(object):
     """Mixin that provides base serialization configuration support."""
 
@@ -159,8 +197,6 @@ class ConfigurationMixin(object):
         :class:`AttributeConfiguration <sqlathanor.attributes.AttributeConfiguration>`
 
         """
-        # pylint: disable=too-many-branches
-
         include_private = not exclude_private
 
         instance_attributes = cls._get_instance_attributes(
@@ -168,6 +204,15 @@ class ConfigurationMixin(object):
             exclude_methods = True
         )
 
+        support_filters = _get_support_filters(from_csv = from_csv,
+                                               to_csv = to_csv,
+                                               from_json = from_json,
+                                               to_json = to_json,
+                                               from_yaml = from_yaml,
+                                               to_yaml = to_yaml,
+                                               from_dict = from_dict,
+                                               to_dict = to_dict)
+
         attributes = []
         for key in instance_attributes:
             try:
@@ -181,69 +226,10 @@ class ConfigurationMixin(object):
             config = AttributeConfiguration(attribute = value)
             config.name = key
 
-            if from_csv is not None and to_csv is None:
-                if config not in attributes and config.supports_csv[0] == bool(from_csv):
-                    attributes.append(config)
-                    continue
-
-            if to_csv is not None and from_csv is None:
-                if config not in attributes and config.supports_csv[1] == bool(to_csv):
-                    attributes.append(config)
-                    continue
-
-            if from_csv is not None and to_csv is not None:
-                if config not in attributes and config.supports_csv == (bool(from_csv),
-                                                                        bool(to_csv)):
-                    attributes.append(config)
-                    continue
-
-            if from_json is not None and to_json is None:
-                if config not in attributes and config.supports_json[0] == bool(from_json):   # pylint: disable=line-too-long
-                    attributes.append(config)
-                    continue
-
-            if to_json is not None and from_json is None:
-                if config not in attributes and config.supports_json[1] == bool(to_json):
-                    attributes.append(config)
-                    continue
-
-            if from_json is not None and to_json is not None:
-                if config not in attributes and config.supports_json == (bool(from_json),
-                                                                         bool(to_json)):
+            for support_filter in support_filters:
+                if _matches_support_filter(config, support_filter):
                     attributes.append(config)
-                    continue
-
-            if from_yaml is not None and to_yaml is None:
-                if config not in attributes and config.supports_yaml[0] == bool(from_yaml):   # pylint: disable=line-too-long
-                    attributes.append(config)
-                    continue
-
-            if to_yaml is not None and from_yaml is None:
-                if config not in attributes and config.supports_yaml[1] == bool(to_yaml):
-                    attributes.append(config)
-                    continue
-
-            if from_yaml is not None and to_yaml is not None:
-                if config not in attributes and config.supports_yaml == (bool(from_yaml),
-                                                                         bool(to_yaml)):
-                    attributes.append(config)
-                    continue
-
-            if from_dict is not None and to_dict is None:
-                if config not in attributes and config.supports_dict[0] == bool(from_dict):   # pylint: disable=line-too-long
-                    attributes.append(config)
-                    continue
-
-            if to_dict is not None and from_dict is None:
-                if config not in attributes and config.supports_dict[1] == bool(to_dict):
-                    attributes.append(config)
-                    continue
-
-            if from_dict is not None and to_dict is not None:
-                if config not in attributes and config.supports_dict == (bool(from_dict),
-                                                                         bool(to_dict)):
-                    attributes.append(config)
-                    continue
+                    break
 
         return attributes
 
@@ -341,10 +327,10 @@ class ConfigurationMixin(object):
         :raises ValueError: if ``config_set`` is not defined within ``__serialization__``
 
         """
-        if config_set and not isinstance(cls.__serialization__, (dict, OrderedDict)):
+        if config_set and not isinstance(cls.__serialization__, dict):
             raise ConfigurationError('__serialization__ is not a dict and therefore no '
                                      'config_set can be found')
-        elif not config_set and isinstance(cls.__serialization__, (dict, OrderedDict)):
+        elif not config_set and isinstance(cls.__serialization__, dict):
             raise ConfigurationError('configuration sets defined but no config_set '
                                      ' specified')
 
@@ -359,77 +345,22 @@ class ConfigurationMixin(object):
         else:
             __serialization__ = [x for x in cls.__serialization__[config_set]]
 
-        if from_csv is not None and to_csv is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_csv[0] == bool(from_csv) and \
-                                  x not in attributes
-                              ])
-        if to_csv is not None and from_csv is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_csv[1] == bool(to_csv) and \
-                                  x not in attributes
-                              ])
-
-        if from_csv is not None and to_csv is not None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_csv[0] == bool(from_csv) and \
-                                  x.supports_csv[1] == bool(to_csv) and \
-                                  x not in attributes
-                              ])
-
-        if from_json is not None and to_json is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_json[0] == bool(from_json) and \
-                                  x not in attributes
-                              ])
-        if to_json is not None and from_json is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_json[1] == bool(to_json) and \
-                                  x not in attributes
-                              ])
-
-        if from_json is not None and to_json is not None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_json[0] == bool(from_json) and \
-                                  x.supports_json[1] == bool(to_json) and \
-                                  x not in attributes
-                              ])
-
-        if from_yaml is not None and to_yaml is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_yaml[0] == bool(from_yaml) and \
-                                  x not in attributes
-                              ])
-        if to_yaml is not None and from_yaml is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_yaml[1] == bool(to_yaml) and \
-                                  x not in attributes
-                              ])
-
-        if from_yaml is not None and to_yaml is not None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_yaml[0] == bool(from_yaml) and \
-                                  x.supports_yaml[1] == bool(to_yaml) and \
-                                  x not in attributes
-                              ])
-
-        if from_dict is not None and to_dict is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_dict[0] == bool(from_dict) and \
-                                  x not in attributes
-                              ])
-        if to_dict is not None and from_dict is None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_dict[1] == bool(to_dict) and \
-                                  x not in attributes
-                              ])
-
-        if from_dict is not None and to_dict is not None:
-            attributes.extend([x for x in __serialization__
-                               if x.supports_dict[0] == bool(from_dict) and \
-                                  x.supports_dict[1] == bool(to_dict) and \
-                                  x not in attributes
-                              ])
+        # Attributes are grouped by the first format filter they satisfy, and
+        # de-duplicated by name (consistent with AttributeConfiguration.__eq__).
+        names = set()
+        for support_filter in _get_support_filters(from_csv = from_csv,
+                                                   to_csv = to_csv,
+                                                   from_json = from_json,
+                                                   to_json = to_json,
+                                                   from_yaml = from_yaml,
+                                                   to_yaml = to_yaml,
+                                                   from_dict = from_dict,
+                                                   to_dict = to_dict):
+            for config in __serialization__:
+                if config.name not in names and \
+                   _matches_support_filter(config, support_filter):
+                    attributes.append(config)
+                    names.add(config.name)
 
         return attributes
 
@@ -451,10 +382,10 @@ class ConfigurationMixin(object):
         :raises ValueError: if ``config_set`` is not defined within ``__serialization__``
 
         """
-        if config_set and not isinstance(cls.__serialization__, (dict, OrderedDict)):
+        if config_set and not isinstance(cls.__serialization__, dict):
             raise ConfigurationError('__serialization__ is not a dict and therefore no '
                                      'config_set can be found')
-        elif not config_set and isinstance(cls.__serialization__, (dict, OrderedDict)):
+        elif not config_set and isinstance(cls.__serialization__, dict):
             raise ConfigurationError('configuration sets defined but no config_set '
                                      ' specified')
 
@@ -584,10 +515,10 @@ class ConfigurationMixin(object):
 
         """
         def _build_set():
-            if config_set and not isinstance(cls.__serialization__, (dict, OrderedDict)):
+            if config_set and not isinstance(cls.__serialization__, dict):
                 raise ConfigurationError('%s object does not use named (%s) configuration sets, '
                                          'but config_set is not None' % (cls, config_set))
-            elif not config_set and isinstance(cls.__serialization__, (dict, OrderedDict)):
+            elif not config_set and isinstance(cls.__serialization__, dict):
                 raise ConfigurationError('%s configuration sets defined but config_set is empty' % cls)
 
             if config_set and config_set not in cls.__serialization__:
@@ -663,13 +594,21 @@ class ConfigurationMixin(object):
         :raises ValueError: if ``config_set`` is not defined within ``__serialization__``
 
         """
-        attributes = cls._heapable('config_%s' % attribute, lambda: cls._get_attribute_configurations(config_set = config_set), config_set)
+        def _build_lookup():
+            # Iterate in reverse so that, as with a linear scan, the first
+            # configuration matching by name or display name wins.
+            lookup = {}
+            for config in reversed(cls._get_attribute_configurations(config_set = config_set)):
+                lookup[config.display_name] = config
+                lookup[config.name] = config
+
+            return lookup
 
-        for config in attributes:
-            if config.name == attribute or config.display_name == attribute:
-                return config.copy()
+        config = cls._heapable('config_lookup', _build_lookup, config_set).get(attribute)
+        if config is None:
+            return None
 
-        return None
+        return config.copy()
 
     @classmethod
     def set_attribute_serialization_config(cls,
@@ -897,10 +836,10 @@ class ConfigurationMixin(object):
 
         """
         # pylint: disable=too-many-branches
-        if config_set and not isinstance(cls.__serialization__, (dict, OrderedDict)):
+        if config_set and not isinstance(cls.__serialization__, dict):
             raise ConfigurationError('__serialization__ is not a dict and therefore no '
                                      'config_set can be found')
-        elif not config_set and isinstance(cls.__serialization__, (dict, OrderedDict)):
+        elif not config_set and isinstance(cls.__serialization__, dict):
             raise ConfigurationError('configuration sets defined but no config_set '
                                      ' specified')
 
@@ -1210,9 +1149,9 @@ class ConfigurationMixin(object):
 
         config.extend(attributes)
 
-        if not config_set and not isinstance(cls.__serialization__, (dict, OrderedDict)):
+        if not config_set and not isinstance(cls.__serialization__, dict):
             cls.__serialization__ = [x for x in config]
-        elif config_set and isinstance(cls.__serialization__, (dict, OrderedDict)):
+        elif config_set and isinstance(cls.__serialization__, dict):
             cls.__serialization__[config_set] = [x for x in config]
         elif config_set:
             config_dict = dict_()
@@ -1317,10 +1256,10 @@ class ConfigurationMixin(object):
 
         """
         # pylint: disable=too-many-boolean-expressions,too-many-branches
-        if config_set and not isinstance(cls.__serialization__, (dict, OrderedDict)):
+        if config_set and not isinstance(cls.__serialization__, dict):
             raise ConfigurationError('object does not use configuration sets, but '
                                      'config_set was not None')
-        elif not config_set and isinstance(cls.__serialization__, (dict, OrderedDict)):
+        elif not config_set and isinstance(cls.__serialization__, dict):
             raise ConfigurationError('configuration sets defined but no config_set '
                                      ' specified')
 
@@ -9,11 +9,15 @@ import csv
 
 from validator_collection import checkers, validators
 
-from sqlathanor._compat import StringIO, dict as dict_
-from sqlathanor.utilities import read_csv_data, get_attribute_names
+from sqlathanor._compat import StringIO, basestring, numeric_types, dict as dict_
+from sqlathanor.utilities import read_csv_data, get_attribute_names, \
+    get_csv_format_params
 from sqlathanor.errors import SerializableAttributeError, \
     UnsupportedSerializationError, CSVStructureError, DeserializationError
 
+# Values of these types are written to CSV as-is, without calling str() on them.
+_CSV_VERBATIM_TYPES = (basestring, ) + numeric_types
+
 
 class CSVSupportMixin(object):
     """Mixin that provides CSV serialization/de-serialization support."""
@@ -44,13 +48,18 @@ class CSVSupportMixin(object):
         :returns: List of CSV column names, sorted according to their configuration.
         :rtype: :class:`list <python:list>` of :class:`str <python:str>`
         """
-        config = cls.get_csv_serialization_config(deserialize = deserialize,
-                                                  serialize = serialize,
-                                                  config_set = config_set)
-        attribute_names = [x.name for x in config]
-        display_names = [x.display_name for x in config]
+        def _build_column_names():
+            config = cls.get_csv_serialization_config(deserialize = deserialize,
+                                                      serialize = serialize,
+                                                      config_set = config_set)
+            return [x.display_name or x.name for x in config]
+
+        column_names = cls._heapable('csv_column_names_s%sd%s' % (str(serialize),
+                                                                  str(deserialize)),
+                                     _build_column_names,
+                                     config_set)
 
-        return [x[0] or x[1] for x in zip(display_names, attribute_names)]
+        return list(column_names)
 
     @classmethod
     def _get_csv_attribute_names(cls,
@@ -74,10 +83,18 @@ class CSVSupportMixin(object):
         :returns: List of attribute names, sorted according to their configuration.
         :rtype: :class:`list <python:list>` of :class:`str <python:str>`
         """
-        config = cls.get_csv_serialization_config(deserialize = deserialize,
-                                                  serialize = serialize,
-                                                  config_set = config_set)
-        return [x.name for x in config]
+        def _build_attribute_names():
+            config = cls.get_csv_serialization_config(deserialize = deserialize,
+                                                      serialize = serialize,
+                                                      config_set = config_set)
+            return [x.name for x in config]
+
+        attribute_names = cls._heapable('csv_attribute_names_s%sd%s' % (str(serialize),
+                                                                        str(deserialize)),
+                                        _build_attribute_names,
+                                        config_set)
+
+        return list(attribute_names)
 
     @classmethod
     def _get_attribute_csv_header(cls,
@@ -125,37 +142,20 @@ class CSVSupportMixin(object):
           listed, separated by the ``delimiter``.
         :rtype: :class:`str <python:str>`
         """
-        if not wrapper_character:
-            wrapper_character = '\''
-
-        if wrap_all_strings:
-            quoting = csv.QUOTE_NONNUMERIC
-        else:
-            quoting = csv.QUOTE_MINIMAL
-
-        if 'sqlathanor' in csv.list_dialects():
-            csv.unregister_dialect('sqlathanor')
-
-        csv.register_dialect('sqlathanor',
-                             delimiter = delimiter,
-                             doublequote = double_wrapper_character_when_nested,
-                             escapechar = escape_character,
-                             quotechar = wrapper_character,
-                             quoting = quoting,
-                             lineterminator = line_terminator)
-
         output = StringIO()
-        csv_writer = csv.DictWriter(output,
-                                    fieldnames = attributes,
-                                    dialect = 'sqlathanor')
+        csv_writer = csv.writer(output,
+                                **get_csv_format_params(delimiter,
+                                                        wrap_all_strings,
+                                                        wrapper_character,
+                                                        double_wrapper_character_when_nested,     # pylint: disable=line-too-long
+                                                        escape_character,
+                                                        line_terminator))
 
-        csv_writer.writeheader()
+        csv_writer.writerow(attributes)
 
         header_string = output.getvalue()
         output.close()
 
-        csv.unregister_dialect('sqlathanor')
-
         return header_string
 
     def _get_attribute_csv_data(self,
@@ -168,7 +168,8 @@ class CSVSupportMixin(object):
                                 double_wrapper_character_when_nested = False,
                                 escape_character = "\\",
                                 line_terminator = '\r\n',
-                                config_set = None):
+                                config_set = None,
+                                stream = None):
         r"""Return the CSV representation of ``attributes`` extracted from the
         model instance (record).
 
@@ -215,31 +216,18 @@ class CSVSupportMixin(object):
           to use. Defaults to :obj:`None <python:None>`.
         :type config_set: :class:`str <python:str>` / :obj:`None <python:None>`
 
-        :returns: Data from the object in CSV format ending in ``line_terminator``.
-        :rtype: :class:`str <python:str>`
-        """
-        if not wrapper_character:
-            wrapper_character = '\''
+        :param stream: If not :obj:`None <python:None>`, a file-like object that the
+          CSV data is written to instead of being returned. Defaults to
+          :obj:`None <python:None>`.
+        :type stream: file-like object / :obj:`None <python:None>`
 
+        :returns: Data from the object in CSV format ending in ``line_terminator``, or
+          :obj:`None <python:None>` if ``stream`` was supplied.
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+        """
         if not attributes:
             raise SerializableAttributeError("attributes cannot be empty")
 
-        if wrap_all_strings:
-            quoting = csv.QUOTE_NONNUMERIC
-        else:
-            quoting = csv.QUOTE_MINIMAL
-
-        if 'sqlathanor' in csv.list_dialects():
-            csv.unregister_dialect('sqlathanor')
-
-        csv.register_dialect('sqlathanor',
-                             delimiter = delimiter,
-                             doublequote = double_wrapper_character_when_nested,
-                             escapechar = escape_character,
-                             quotechar = wrapper_character,
-                             quoting = quoting,
-                             lineterminator = line_terminator)
-
         data = []
         for item in attributes:
             try:
@@ -252,31 +240,32 @@ class CSVSupportMixin(object):
                 else:
                     raise error
 
-            data.append(value)
-
-        for index, item in enumerate(data):
-            if item == '' or item is None or item == 'None':
-                data[index] = null_text
-            elif not checkers.is_string(item) and not checkers.is_numeric(item):
-                data[index] = str(item)
+            if value is None or value == '' or value == 'None':
+                value = null_text
+            elif not isinstance(value, _CSV_VERBATIM_TYPES) and \
+                 not checkers.is_string(value) and \
+                 not checkers.is_numeric(value):
+                value = str(value)
 
-        data_dict = dict_()
-        for index, column_name in enumerate(attributes):
-            data_dict[column_name] = data[index]
+            data.append(value)
 
-        output = StringIO()
-        csv_writer = csv.DictWriter(output,
-                                    fieldnames = attributes,
-                                    dialect = 'sqlathanor')
+        output = stream if stream is not None else StringIO()
+        csv_writer = csv.writer(output,
+                                **get_csv_format_params(delimiter,
+                                                        wrap_all_strings,
+                                                        wrapper_character,
+                                                        double_wrapper_character_when_nested,     # pylint: disable=line-too-long
+                                                        escape_character,
+                                                        line_terminator))
 
+        csv_writer.writerow(data)
 
-        csv_writer.writerow(data_dict)
+        if stream is not None:
+            return None
 
         data_row = output.getvalue()
         output.close()
 
-        csv.unregister_dialect('sqlathanor')
-
         return data_row
 
     @classmethod
@@ -341,18 +330,29 @@ class CSVSupportMixin(object):
         """
         # pylint: disable=line-too-long
 
-        column_names = cls.get_csv_column_names(deserialize = deserialize,
-                                                serialize = serialize,
-                                                config_set = config_set)
-
-        header_string = cls._get_attribute_csv_header(column_names,
-                                                      delimiter = delimiter,
-                                                      wrap_all_strings = wrap_all_strings,
-                                                      wrapper_character = wrapper_character,
-                                                      double_wrapper_character_when_nested = double_wrapper_character_when_nested,
-                                                      escape_character = escape_character,
-                                                      line_terminator = line_terminator)
-        return header_string
+        def _build_header():
+            column_names = cls.get_csv_column_names(deserialize = deserialize,
+                                                    serialize = serialize,
+                                                    config_set = config_set)
+
+            return cls._get_attribute_csv_header(column_names,
+                                                 delimiter = delimiter,
+                                                 wrap_all_strings = wrap_all_strings,
+                                                 wrapper_character = wrapper_character,
+                                                 double_wrapper_character_when_nested = double_wrapper_character_when_nested,
+                                                 escape_character = escape_character,
+                                                 line_terminator = line_terminator)
+
+        key = 'csv_header_s%sd%s_%r' % (str(serialize),
+                                        str(deserialize),
+                                        (delimiter,
+                                         wrap_all_strings,
+                                         wrapper_character,
+                                         double_wrapper_character_when_nested,
+                                         escape_character,
+                                         line_terminator))
+
+        return cls._heapable(key, _build_header, config_set)
 
     def get_csv_data(self,
                      delimiter = '|',
@@ -362,7 +362,8 @@ class CSVSupportMixin(object):
                      double_wrapper_character_when_nested = False,
                      escape_character = "\\",
                      line_terminator = '\r\n',
-                     config_set = None):
+                     config_set = None,
+                     stream = None):
         r"""Return the CSV representation of the model instance (record).
 
         :param delimiter: The delimiter used between columns. Defaults to ``|``.
@@ -399,8 +400,14 @@ class CSVSupportMixin(object):
           to use. Defaults to :obj:`None <python:None>`.
         :type config_set: :class:`str <python:str>` / :obj:`None <python:None>`
 
-        :returns: Data from the object in CSV format ending in ``line_terminator``.
-        :rtype: :class:`str <python:str>`
+        :param stream: If not :obj:`None <python:None>`, a file-like object that the
+          CSV output is written to instead of being returned. Defaults to
+          :obj:`None <python:None>`.
+        :type stream: file-like object / :obj:`None <python:None>`
+
+        :returns: Data from the object in CSV format ending in ``line_terminator``, or
+          :obj:`None <python:None>` if ``stream`` was supplied.
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
         # pylint: disable=line-too-long
         csv_attribute_names = [x
@@ -421,7 +428,8 @@ class CSVSupportMixin(object):
                                                 double_wrapper_character_when_nested = double_wrapper_character_when_nested,
                                                 escape_character = escape_character,
                                                 line_terminator = line_terminator,
-                                                config_set = config_set)
+                                                config_set = config_set,
+                                                stream = stream)
 
         return data_row
 
@@ -434,7 +442,8 @@ class CSVSupportMixin(object):
                double_wrapper_character_when_nested = False,
                escape_character = "\\",
                line_terminator = '\r\n',
-               config_set = None):
+               config_set = None,
+               stream = None):
         r"""Retrieve a CSV string with the object's data.
 
         :param include_header: If ``True``, will include a header row with column
@@ -475,30 +484,135 @@ class CSVSupportMixin(object):
           to use. Defaults to :obj:`None <python:None>`.
         :type config_set: :class:`str <python:str>` / :obj:`None <python:None>`
 
-        :returns: Data from the object in CSV format ending in a newline (``\n``).
-        :rtype: :class:`str <python:str>`
+        :param stream: If not :obj:`None <python:None>`, a file-like object (e.g. an
+          open file or :class:`StringIO <python:io.StringIO>`) that the CSV output is
+          written to instead of being returned. Useful when serializing many records
+          into one output. Defaults to :obj:`None <python:None>`.
+        :type stream: file-like object / :obj:`None <python:None>`
+
+        :returns: Data from the object in CSV format ending in a newline (``\n``), or
+          :obj:`None <python:None>` if ``stream`` was supplied.
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
+        header = ''
         if include_header:
-            return self.get_csv_header(delimiter = delimiter,
-                                       config_set = config_set) + \
-                   self.get_csv_data(delimiter = delimiter,
+            header = self.get_csv_header(delimiter = delimiter,
+                                         config_set = config_set)
+            if stream is not None:
+                stream.write(header)
+
+        data_row = self.get_csv_data(delimiter = delimiter,
                                      wrap_all_strings = wrap_all_strings,
                                      null_text = null_text,
                                      wrapper_character = wrapper_character,
                                      double_wrapper_character_when_nested = double_wrapper_character_when_nested,     # pylint: disable=line-too-long
                                      escape_character = escape_character,
                                      line_terminator = line_terminator,
-                                     config_set = config_set)
+                                     config_set = config_set,
+                                     stream = stream)
+
+        if stream is not None:
+            return None
+
+        return header + data_row
+
+    @classmethod
+    def to_csv_many(cls,
+                    instances,
+                    include_header = False,
+                    delimiter = '|',
+                    wrap_all_strings = False,
+                    null_text = 'None',
+                    wrapper_character = "'",
+                    double_wrapper_character_when_nested = False,
+                    escape_character = "\\",
+                    line_terminator = '\r\n',
+                    config_set = None,
+                    stream = None):
+        r"""Retrieve a CSV string with the data of several instances of the model
+        class, one record per line.
+
+        This is equivalent to concatenating the output of
+        :meth:`to_csv() <BaseModel.to_csv>` for each instance, except that the header
+        row (if requested) is only written once and all records are written into a
+        single output buffer.
+
+        :param instances: The :term:`model instances <model instance>` to serialize.
+        :type instances: iterable of :term:`model instances <model instance>`
+
+        :param include_header: If ``True``, will include a header row with column
+          labels. If ``False``, will not include a header row. Defaults to ``False``.
+        :type include_header: :class:`bool <python:bool>`
+
+        :param delimiter: The delimiter used between columns. Defaults to ``|``.
+        :type delimiter: :class:`str <python:str>`
+
+        :param wrap_all_strings: If ``True``, wraps any string data in the
+          ``wrapper_character``. If ``None``, only wraps string data if it contains
+          the ``delimiter``. Defaults to ``False``.
+        :type wrap_all_strings: :class:`bool <python:bool>`
+
+        :param null_text: The text value to use in place of empty values. Only
+          applies if ``wrap_empty_values`` is ``True``. Defaults to ``'None'``.
+        :type null_text: :class:`str <python:str>`
+
+        :param wrapper_character: The string used to wrap string values when
+          wrapping is necessary. Defaults to ``'``.
+        :type wrapper_character: :class:`str <python:str>`
+
+        :param double_wrapper_character_when_nested: If ``True``, will double the
+          ``wrapper_character`` when it is found inside a column value. If ``False``,
+          will precede the ``wrapper_character`` by the ``escape_character`` when
+          it is found inside a column value. Defaults to ``False``.
+        :type double_wrapper_character_when_nested: :class:`bool <python:bool>`
 
+        :param escape_character: The character to use when escaping nested wrapper
+          characters. Defaults to ``\``.
+        :type escape_character: :class:`str <python:str>`
+
+        :param line_terminator: The character used to mark the end of a line.
+          Defaults to ``\r\n``.
+        :type line_terminator: :class:`str <python:str>`
+
+        :param config_set: If not :obj:`None <python:None>`, the named configuration set
+          to use. Defaults to :obj:`None <python:None>`.
+        :type config_set: :class:`str <python:str>` / :obj:`None <python:None>`
+
+        :param stream: If not :obj:`None <python:None>`, a file-like object that the
+          CSV output is written to instead of being returned. Defaults to
+          :obj:`None <python:None>`.
+        :type stream: file-like object / :obj:`None <python:None>`
 
-        return self.get_csv_data(delimiter = delimiter,
-                                 wrap_all_strings = wrap_all_strings,
-                                 null_text = null_text,
-                                 wrapper_character = wrapper_character,
-                                 double_wrapper_character_when_nested = double_wrapper_character_when_nested,     # pylint: disable=line-too-long
-                                 escape_character = escape_character,
-                                 line_terminator = line_terminator,
-                                 config_set = config_set)
+        :returns: Data from the instances in CSV format, or :obj:`None <python:None>`
+          if ``stream`` was supplied.
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+        """
+        # pylint: disable=line-too-long
+        output = stream if stream is not None else StringIO()
+
+        if include_header:
+            output.write(cls.get_csv_header(delimiter = delimiter,
+                                            config_set = config_set))
+
+        for instance in instances:
+            instance.to_csv(include_header = False,
+                            delimiter = delimiter,
+                            wrap_all_strings = wrap_all_strings,
+                            null_text = null_text,
+                            wrapper_character = wrapper_character,
+                            double_wrapper_character_when_nested = double_wrapper_character_when_nested,
+                            escape_character = escape_character,
+                            line_terminator = line_terminator,
+                            config_set = config_set,
+                            stream = output)
+
+        if stream is not None:
+            return None
+
+        csv_string = output.getvalue()
+        output.close()
+
+        return csv_string
 
     @classmethod
     def _parse_csv(cls,
@@ -555,25 +669,6 @@ class CSVSupportMixin(object):
             raise DeserializationError("csv_data expects a 'str', received '%s'" \
                                        % type(csv_data))
 
-        if not wrapper_character:
-            wrapper_character = '\''
-
-        if wrap_all_strings:
-            quoting = csv.QUOTE_NONNUMERIC
-        else:
-            quoting = csv.QUOTE_MINIMAL
-
-        if 'sqlathanor' in csv.list_dialects():
-            csv.unregister_dialect('sqlathanor')
-
-        csv.register_dialect('sqlathanor',
-                             delimiter = delimiter,
-                             doublequote = double_wrapper_character_when_nested,
-                             escapechar = escape_character,
-                             quotechar = wrapper_character,
-                             quoting = quoting,
-                             lineterminator = line_terminator)
-
         csv_column_names = [x
                             for x in cls.get_csv_column_names(deserialize = True,
                                                               serialize = None,
@@ -581,9 +676,14 @@ class CSVSupportMixin(object):
 
         csv_reader = csv.DictReader([csv_data],
                                     fieldnames = csv_column_names,
-                                    dialect = 'sqlathanor',
                                     restkey = None,
-                                    restval = None)
+                                    restval = None,
+                                    **get_csv_format_params(delimiter,
+                                                            wrap_all_strings,
+                                                            wrapper_character,
+                                                            double_wrapper_character_when_nested,     # pylint: disable=line-too-long
+                                                            escape_character,
+                                                            line_terminator))
 
         rows = [x for x in csv_reader]
 
@@ -614,8 +714,6 @@ class CSVSupportMixin(object):
 
             deserialized_data[attribute_name] = deserialized_value
 
-        csv.unregister_dialect('sqlathanor')
-
         return deserialized_data
 
     def update_from_csv(self,
@@ -8,16 +8,24 @@
 import warnings
 
 from validator_collection import validators, checkers
-from validator_collection.errors import NotAnIterableError
 
-from sqlathanor._compat import json, dict as dict_
+from sqlathanor._compat import json, basestring, dict as dict_
 from sqlathanor.attributes import AttributeConfiguration
-from sqlathanor.utilities import iterable__to_dict, get_attribute_names
+from sqlathanor.utilities import iterable__to_dict, get_attribute_names, \
+    SUPPORTED_FORMATS, LITERAL_TYPES, SCALAR_TYPES
 from sqlathanor.errors import DeserializableAttributeError, DeserializationError, \
     InvalidFormatError, ExtraKeyError, MaximumNestingExceededError, \
     MaximumNestingExceededWarning, SerializableAttributeError, \
     UnsupportedSerializationError
 
+# Name of the serialization config getter for each supported format.
+_CONFIG_GETTERS = {
+    'csv': 'get_csv_serialization_config',
+    'json': 'get_json_serialization_config',
+    'yaml': 'get_yaml_serialization_config',
+    'dict': 'get_dict_serialization_config'
+}
+
 class DictSupportMixin(object):
     """Mixin that provides :class:`dict <python:dict>` serialization/de-serialization
     support.
@@ -69,7 +77,7 @@ class DictSupportMixin(object):
           :class:`dict <python:dict>` or if ``input_data`` is empty.
         :raises InvalidFormatError: if ``format`` is not a supported value
         """
-        if format not in ['csv', 'json', 'yaml', 'dict']:
+        if not isinstance(format, basestring) or format not in SUPPORTED_FORMATS:
             raise InvalidFormatError("format '%s' not supported" % format)
 
         try:
@@ -84,14 +92,7 @@ class DictSupportMixin(object):
 
         dict_object = dict_()
 
-        if format == 'csv':
-            attribute_getter = cls.get_csv_serialization_config
-        elif format == 'json':
-            attribute_getter = cls.get_json_serialization_config
-        elif format == 'yaml':
-            attribute_getter = cls.get_yaml_serialization_config
-        elif format == 'dict':
-            attribute_getter = cls.get_dict_serialization_config
+        attribute_getter = getattr(cls, _CONFIG_GETTERS[format])
 
         attributes = [x
                       for x in attribute_getter(deserialize = True,
@@ -186,7 +187,7 @@ class DictSupportMixin(object):
 
         next_nesting = current_nesting + 1
 
-        if format not in ['csv', 'json', 'yaml', 'dict']:
+        if not isinstance(format, basestring) or format not in SUPPORTED_FORMATS:
             raise InvalidFormatError("format '%s' not supported" % format)
 
         if current_nesting > max_nesting:
@@ -197,14 +198,7 @@ class DictSupportMixin(object):
 
         dict_object = dict_()
 
-        if format == 'csv':
-            attribute_getter = self.get_csv_serialization_config
-        elif format == 'json':
-            attribute_getter = self.get_json_serialization_config
-        elif format == 'yaml':
-            attribute_getter = self.get_yaml_serialization_config
-        elif format == 'dict':
-            attribute_getter = self.get_dict_serialization_config
+        attribute_getter = getattr(self, _CONFIG_GETTERS[format])
 
         if not is_dumping:
             attributes = [x
@@ -245,13 +239,14 @@ class DictSupportMixin(object):
 
         for attribute in attributes:
             item = getattr(self, attribute.name, None)
-            if hasattr(item, '_to_dict'):
+            item_to_dict = getattr(item, '_to_dict', None)
+            if item_to_dict is not None:
                 try:
-                    value = item._to_dict(format,                               # pylint: disable=protected-access
-                                          max_nesting = max_nesting,
-                                          current_nesting = next_nesting,
-                                          is_dumping = is_dumping,
-                                          config_set = config_set)
+                    value = item_to_dict(format,
+                                         max_nesting = max_nesting,
+                                         current_nesting = next_nesting,
+                                         is_dumping = is_dumping,
+                                         config_set = config_set)
                 except MaximumNestingExceededError:
                     warnings.warn(
                         "skipping key '%s' because maximum nesting has been exceeded" \
@@ -264,8 +259,12 @@ class DictSupportMixin(object):
                     on_serialize_function = attribute.on_serialize[format]
                     item = on_serialize_function(item)
 
-                if checkers.is_iterable(item,
-                                        forbid_literals = (str, bytes, dict)):
+                # Scalars (the common case) are never iterable, so skip the
+                # comparatively expensive is_iterable() check for them.
+                if item is not None and \
+                   type(item) not in SCALAR_TYPES and \
+                   checkers.is_iterable(item,
+                                        forbid_literals = LITERAL_TYPES):
                     try:
                         value = iterable__to_dict(item,
                                                   format,
@@ -280,16 +279,6 @@ class DictSupportMixin(object):
                             MaximumNestingExceededWarning
                         )
                         continue
-                    except NotAnIterableError:
-                        try:
-                            value = self._get_serialized_value(format,
-                                                               attribute.name,
-                                                               config_set = config_set)
-                        except UnsupportedSerializationError as error:
-                            if is_dumping:
-                                value = getattr(self, attribute.name)
-                            else:
-                                raise error
                 else:
                     try:
                         value = self._get_serialized_value(format,
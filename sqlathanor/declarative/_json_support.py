@@ -46,6 +46,15 @@ class JSONSupportMixin(object):
             If you wish to pass additional arguments to your ``serialize_function``
             pass them as keyword arguments (in ``kwargs``).
 
+          .. tip::
+
+            If `orjson <https://github.com/ijl/orjson>`_ is installed, passing
+            ``serialize_function = lambda value: orjson.dumps(value).decode('utf-8')``
+            serializes considerably faster. Be aware that its output is compact
+            (no whitespace after separators) and that it does not accept
+            :class:`Decimal <python:decimal.Decimal>` values, so it is not used by
+            default.
+
         :type serialize_function: callable / :obj:`None <python:None>`
 
         :param config_set: If not :obj:`None <python:None>`, the named configuration set
@@ -86,6 +95,75 @@ class JSONSupportMixin(object):
 
         return as_json
 
+    @classmethod
+    def to_json_many(cls,
+                     instances,
+                     max_nesting = 0,
+                     current_nesting = 0,
+                     serialize_function = None,
+                     config_set = None,
+                     **kwargs):
+        """Return a JSON representation of several instances of the model class,
+        as a JSON array.
+
+        Each instance is converted exactly as by :meth:`to_json() <BaseModel.to_json>`,
+        but the resulting list is passed to the JSON serializer in a single call.
+
+        :param instances: The :term:`model instances <model instance>` to serialize.
+        :type instances: iterable of :term:`model instances <model instance>`
+
+        :param max_nesting: The maximum number of levels that the resulting
+          JSON objects can be nested. If set to ``0``, will
+          not nest other serializable objects. Defaults to ``0``.
+        :type max_nesting: :class:`int <python:int>`
+
+        :param current_nesting: The current nesting level at which the
+          :class:`dict <python:dict>` representations will reside. Defaults to ``0``.
+        :type current_nesting: :class:`int <python:int>`
+
+        :param serialize_function: Optionally override the default JSON serializer.
+          Defaults to :obj:`None <python:None>`, which applies the default
+          :doc:`simplejson <simplejson:index>` JSON serializer. It receives a
+          :class:`list <python:list>` of :class:`dict <python:dict>` objects.
+        :type serialize_function: callable / :obj:`None <python:None>`
+
+        :param config_set: If not :obj:`None <python:None>`, the named configuration set
+          to use. Defaults to :obj:`None <python:None>`.
+        :type config_set: :class:`str <python:str>` / :obj:`None <python:None>`
+
+        :param kwargs: Optional keyword parameters that are passed to the
+          JSON serializer function. By default, these are options which are passed
+          to :func:`simplejson.dumps() <simplejson:simplejson.dumps>`.
+        :type kwargs: keyword arguments
+
+        :returns: A :class:`str <python:str>` with the JSON representation of the
+          instances.
+        :rtype: :class:`str <python:str>`
+
+        :raises SerializableAttributeError: if attributes is empty
+        :raises MaximumNestingExceededError: if ``current_nesting`` is greater
+          than ``max_nesting``
+        :raises MaximumNestingExceededWarning: if an attribute requires nesting
+          beyond ``max_nesting``
+
+        """
+        if serialize_function is None:
+            serialize_function = json.dumps
+        else:
+            if checkers.is_callable(serialize_function) is False:
+                raise ValueError(
+                    'serialize_function (%s) is not callable' % serialize_function
+                )
+
+        as_list = [instance._to_dict('json',
+                                     max_nesting = max_nesting,
+                                     current_nesting = current_nesting,
+                                     is_dumping = False,
+                                     config_set = config_set)
+                   for instance in instances]
+
+        return serialize_function(as_list, **kwargs)
+
     def dump_to_json(self,
                      max_nesting = 0,
                      current_nesting = 0,
@@ -127,6 +205,15 @@ class JSONSupportMixin(object):
             If you wish to pass additional arguments to your ``serialize_function``
             pass them as keyword arguments (in ``kwargs``).
 
+          .. tip::
+
+            If `orjson <https://github.com/ijl/orjson>`_ is installed, passing
+            ``serialize_function = lambda value: orjson.dumps(value).decode('utf-8')``
+            serializes considerably faster. Be aware that its output is compact
+            (no whitespace after separators) and that it does not accept
+            :class:`Decimal <python:decimal.Decimal>` values, so it is not used by
+            default.
+
         :type serialize_function: callable / :obj:`None <python:None>`
 
         :param config_set: If not :obj:`None <python:None>`, the named configuration set
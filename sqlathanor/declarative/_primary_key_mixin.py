@@ -57,10 +57,13 @@ class PrimaryKeyMixin(object):
         :rtype: scalar / :class:`tuple <python:tuple>` / :obj:`None <python:None>`
 
         """
-        if not inspect(self).has_identity or not inspect(self).identity:
+        state = inspect(self)
+        if not state.has_identity:
             return None
 
-        primary_keys = inspect(self).identity
+        primary_keys = state.identity
+        if not primary_keys:
+            return None
 
         if len(primary_keys) == 1:
             return primary_keys[0]
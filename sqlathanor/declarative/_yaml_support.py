@@ -8,9 +8,8 @@
 from collections import OrderedDict
 
 from validator_collection import checkers
-import yaml
 
-from sqlathanor.utilities import parse_yaml
+from sqlathanor.utilities import parse_yaml, yaml_dump
 
 class YAMLSupportMixin(object):
     """Mixin that provides YAML serialization/de-serialization support."""
@@ -71,7 +70,7 @@ class YAMLSupportMixin(object):
 
         """
         if serialize_function is None:
-            serialize_function = yaml.dump
+            serialize_function = yaml_dump
         else:
             if checkers.is_callable(serialize_function) is False:
                 raise ValueError(
@@ -155,7 +154,7 @@ class YAMLSupportMixin(object):
 
         """
         if serialize_function is None:
-            serialize_function = yaml.dump
+            serialize_function = yaml_dump
         else:
             if checkers.is_callable(serialize_function) is False:
                 raise ValueError(
@@ -6,7 +6,6 @@
 # there as needed.
 
 import inspect as inspect_
-import yaml
 
 from sqlathanor._compat import json
 from sqlathanor.attributes import validate_serialization_config
@@ -158,23 +157,23 @@ class BaseModel(PrimaryKeyMixin,
         config = self.get_attribute_serialization_config(attribute,
                                                          config_set = config_set)
 
+        value = getattr(self, attribute, None)
+
         on_serialize = config.on_serialize[format]
         if on_serialize is None:
             on_serialize = get_default_serializer(getattr(self.__class__,
                                                           attribute),
                                                   format = format,
-                                                  value = getattr(self,
-                                                                  attribute,
-                                                                  None))
+                                                  value = value)
 
         if on_serialize is None:
-            if format == 'csv':
+            if format == 'csv' and value is None:
                 return getattr(self, attribute, '')
 
-            return getattr(self, attribute, None)
+            return value
 
         try:
-            return_value = on_serialize(getattr(self, attribute, None))
+            return_value = on_serialize(value)
         except Exception:
             raise ValueSerializationError(
                 "attribute '%s' failed serialization to format '%s'" % (attribute,
@@ -267,7 +266,6 @@ class BaseModel(PrimaryKeyMixin,
                     as_json = json.dumps(value)
                     return_value = resolved_class.new_from_json(as_json, config_set=config_set, **kwargs)
                 elif hasattr(resolved_class, 'new_from_yaml') and format == 'yaml' and isinstance(value, dict):
-                    as_yaml = yaml.dump(value)
                     return_value = resolved_class.new_from_yaml(value, config_set=config_set, **kwargs)
                 elif hasattr(resolved_class, 'new_from_dict') and format == 'dict' and isinstance(value, dict):
                     return_value = resolved_class.new_from_dict(value, config_set=config_set, **kwargs)
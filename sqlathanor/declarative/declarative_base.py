@@ -6,12 +6,36 @@
 # there as needed.
 
 from sqlalchemy.ext.declarative import declarative_base as SA_declarative_base
+from sqlalchemy.ext.declarative import DeclarativeMeta as SA_DeclarativeMeta
 from validator_collection import checkers
 
 from sqlathanor.declarative.base_model import BaseModel
+from sqlathanor.utilities import bump_class_version
 
 # pylint: disable=no-member
 
+class DeclarativeMeta(SA_DeclarativeMeta):
+    """Metaclass for the classes produced by :func:`declarative_base`.
+
+    Extends SQLAlchemy's ``DeclarativeMeta`` to record every attribute that is
+    set on or deleted from a model class (including relationships added by a
+    ``backref``), so that the attribute names **SQLAthanor** caches for the class
+    can be validated without inspecting its namespace.
+    """
+
+    def __init__(cls, classname, bases, dict_):
+        super(DeclarativeMeta, cls).__init__(classname, bases, dict_)
+        bump_class_version(cls)
+
+    def __setattr__(cls, key, value):
+        super(DeclarativeMeta, cls).__setattr__(key, value)
+        bump_class_version(cls)
+
+    def __delattr__(cls, key):
+        super(DeclarativeMeta, cls).__delattr__(key)
+        bump_class_version(cls)
+
+
 def declarative_base(cls = BaseModel, **kwargs):
     """Construct a base class for declarative class definitions.
 
@@ -34,7 +58,8 @@ def declarative_base(cls = BaseModel, **kwargs):
 
     :param kwargs: Additional keyword arguments supported by the original
       :func:`sqlalchemy.ext.declarative.declarative_base() <sqlalchemy:sqlalchemy.ext.declarative.declarative_base>`
-      function
+      function. Unless a ``metaclass`` is supplied, the base class uses
+      :class:`DeclarativeMeta`.
     :type kwargs: keyword arguments
 
     :returns: Base class for declarative class definitions with support for
@@ -50,6 +75,8 @@ def declarative_base(cls = BaseModel, **kwargs):
         class_list.extend(cls)
         cls = (x for x in class_list)
 
+    kwargs.setdefault('metaclass', DeclarativeMeta)
+
     return SA_declarative_base(cls = cls, **kwargs)
 
 
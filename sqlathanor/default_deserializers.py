@@ -10,9 +10,10 @@ import io
 
 from validator_collection import validators, checkers
 
-from sqlathanor._compat import json
+from sqlathanor._compat import json, basestring
 from sqlathanor.utilities import format_to_tuple, get_class_type_key, \
-    raise_UnsupportedSerializationError, raise_UnsupportedDeserializationError
+    raise_UnsupportedSerializationError, raise_UnsupportedDeserializationError, \
+    SUPPORTED_FORMATS
 from sqlathanor.errors import UnsupportedValueTypeError
 
 from sqlalchemy.types import Boolean, Date, DateTime, Float, Integer, Text, Time, Interval
@@ -45,8 +46,9 @@ def get_default_deserializer(class_attribute = None,
 
     :raises InvalidFormatError: if ``format`` is not a valid format type
     """
-    format_to_tuple(format)
-    format = format.lower()
+    if not isinstance(format, basestring) or format not in SUPPORTED_FORMATS:
+        format_to_tuple(format)
+        format = format.lower()
 
     class_type_key = get_class_type_key(class_attribute, None)
 
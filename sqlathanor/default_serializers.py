@@ -7,8 +7,9 @@
 
 from validator_collection import validators
 
+from sqlathanor._compat import basestring
 from sqlathanor.utilities import format_to_tuple, get_class_type_key, \
-    raise_UnsupportedSerializationError
+    raise_UnsupportedSerializationError, SUPPORTED_FORMATS
 from sqlathanor.errors import ValueSerializationError
 
 def get_default_serializer(class_attribute = None,
@@ -36,8 +37,9 @@ def get_default_serializer(class_attribute = None,
 
     :raises InvalidFormatError: if ``format`` is not a valid format type
     """
-    format_to_tuple(format)
-    format = format.lower()
+    if not isinstance(format, basestring) or format not in SUPPORTED_FORMATS:
+        format_to_tuple(format)
+        format = format.lower()
 
     class_type_key = get_class_type_key(class_attribute, value)
 
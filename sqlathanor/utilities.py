@@ -10,30 +10,164 @@ This module defines a variety of utility functions which are used throughout
 
 """
 import csv
-import linecache
-import warnings
+import datetime
+import itertools
+import operator
+import os
+import re
+import types
+import weakref
 import yaml
-from collections import OrderedDict
+from collections import Counter
+from decimal import Decimal
 
 from sqlalchemy.orm.collections import InstrumentedList
+from sqlalchemy.types import NullType
 from sqlalchemy.exc import InvalidRequestError as SA_InvalidRequestError
 from sqlalchemy.exc import UnsupportedCompilationError as SA_UnsupportedCompilationError
 
 from validator_collection import validators, checkers
-from validator_collection.errors import NotAnIterableError
 
-from sqlathanor._compat import json, is_py2, is_py36, is_py35, dict as dict_
+from sqlathanor._compat import json, orjson, is_py2, basestring, long, \
+    str as str_, dict as dict_, StringIO
 from sqlathanor.errors import InvalidFormatError, UnsupportedSerializationError, \
     UnsupportedDeserializationError, MaximumNestingExceededError, \
-    MaximumNestingExceededWarning, DeserializationError, CSVStructureError
+    DeserializationError, CSVStructureError
 
-UTILITY_COLUMNS = [
+try:
+    from yaml import CSafeLoader as _YamlLoader, CDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, Dumper as _YamlDumper
+
+UTILITY_COLUMNS = frozenset([
     'metadata',
     'primary_key_value',
     '_decl_class_registry',
     '_sa_instance_state',
     '_sa_class_manager'
-]
+])
+
+SUPPORTED_FORMATS = frozenset(['csv', 'json', 'yaml', 'dict'])
+
+FORMAT_TUPLES = {
+    'csv': (True, None, None, None),
+    'json': (None, True, None, None),
+    'yaml': (None, None, True, None),
+    'dict': (None, None, None, True)
+}
+
+# Exact types whose values are returned as-is by iterable__to_dict().
+SCALAR_TYPES = frozenset([int, long, float, complex, bool, str, str_, bytes])
+
+# NumPy dtype kinds (bool, signed/unsigned int, float) whose 1-dimensional
+# arrays can be converted wholesale using ``ndarray.tolist()``.
+_NUMERIC_DTYPE_KINDS = frozenset(['b', 'i', 'u', 'f'])
+
+_MISSING = object()
+
+# Iterable types that are treated as single values rather than collections.
+LITERAL_TYPES = (str, bytes, dict)
+
+_LIST_TYPES = (list, InstrumentedList)
+
+# Types whose presence in an attribute value marks the attribute as nested.
+_NESTED_TYPES = ('BaseModel', 'RelationshipProperty', 'AssociationProxy', dict)
+
+_BUILTIN_COLLECTION_TYPES = (list, tuple, set, frozenset)
+_SEQUENCE_TYPES = (list, tuple)
+
+# How _iterable__to_dict() handles an item, by type: passed through as-is,
+# converted with ``_to_dict()``, replaced by an empty list, or traversed as a
+# built-in collection / other iterable / ``__getitem__``-only sequence.
+_KIND_VALUE, _KIND_MODEL, _KIND_NONE, _KIND_COLLECTION, _KIND_ITERABLE, \
+    _KIND_GETITEM = range(6)
+_NONE_TYPE = type(None)
+
+_TRUE_PAIR = (True, True)
+_FALSE_PAIR = (False, False)
+
+BLANK_FORMAT_CALLABLES = {
+    'csv': None,
+    'json': None,
+    'yaml': None,
+    'dict': None
+}
+
+_ATTRIBUTE_NAME_CACHE = weakref.WeakKeyDictionary()
+
+# Per-class counters bumped whenever an attribute is set on or deleted from a
+# class whose metaclass reports such changes (see bump_class_version()).
+_CLASS_VERSIONS = weakref.WeakKeyDictionary()
+
+# ``Py_TPFLAGS_HEAPTYPE``: types without it (e.g. ``object``) are immutable.
+_HEAPTYPE_FLAG = 1 << 9
+_METHOD_NAMES_KEY = 'methods'
+_METHOD_TYPES = (types.FunctionType, classmethod, staticmethod)
+_EMPTY_FROZENSET = frozenset()
+_CLASS_TYPE_KEY_CACHE = weakref.WeakKeyDictionary()
+
+# Keyed by ``id()`` and holding a weak reference to the attribute itself:
+# SQLAlchemy attributes overload ``==`` (which a WeakKeyDictionary relies on) to
+# build SQL expressions, so the cache has to match on identity instead.
+_CLASS_ATTRIBUTE_TYPE_KEY_CACHE = {}
+
+# Built-in value types are never garbage collected, so their keys can live in a
+# plain dict that is cheaper to probe than the weak-keyed cache.
+_BUILTIN_TYPE_KEYS = dict((type_, type_.__name__)
+                          for type_ in (int, long, float, complex, bool, str,
+                                        str_, bytes, list, tuple, set,
+                                        frozenset, dict, dict_, Decimal,
+                                        datetime.date, datetime.datetime,
+                                        datetime.time, datetime.timedelta))
+
+def _orjson_raises_on_overflow():
+    """Indicate whether the installed ``orjson`` raises ``JSONDecodeError`` for
+    integers wider than 64 bits, rather than silently converting them to
+    :class:`float <python:float>`.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if orjson is None:
+        return True
+
+    try:
+        orjson.loads('18446744073709551616')
+    except orjson.JSONDecodeError:
+        return True
+
+    return False
+
+# Where orjson converts wide integers to float, any run of 19+ digits routes
+# parsing to the arbitrary-precision default deserializer instead.
+_LONG_DIGIT_RUN = None if _orjson_raises_on_overflow() else re.compile(r'[0-9]{19,}')
+
+# Validator functions bound once so per-call use skips the module attribute
+# lookup.
+_validate_iterable = validators.iterable
+_validate_string = validators.string
+_is_callable = checkers.is_callable
+_is_type = checkers.is_type
+_is_iterable = checkers.is_iterable
+
+def _is_file(value):
+    """Indicate whether ``value`` is the path to an existing file.
+
+    Equivalent to :func:`checkers.is_file() <validator_collection.checkers.is_file>`,
+    but checks strings with a single :func:`os.path.isfile() <python:os.path.isfile>`
+    call. The validator instead raises (and formats a message containing) an
+    exception for every string that is not a file, which is the common case
+    when ``value`` holds serialized data.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if isinstance(value, basestring):
+        try:
+            return os.path.isfile(value)
+        except (TypeError, ValueError):
+            return False
+
+    return checkers.is_file(value)
+
 
 def bool_to_tuple(input):
     """Converts a single :class:`bool <python:bool>` value to a
@@ -51,10 +185,12 @@ def bool_to_tuple(input):
     """
 
     if input is True:
-        input = (True, True)
-    elif not input:
-        input = (False, False)
-    elif not isinstance(input, tuple) or len(input) > 2:
+        return _TRUE_PAIR
+
+    if not input:
+        return _FALSE_PAIR
+
+    if not isinstance(input, tuple) or len(input) > 2:
         raise ValueError('input was neither a bool nor a 2-member tuple')
 
     return input
@@ -73,31 +209,16 @@ def callable_to_dict(input):
     :rtype: :class:`dict <python:dict>`
 
     """
-    if input is not None and not isinstance(input, (dict, OrderedDict)):
-        input = {
-            'csv': input,
-            'json': input,
-            'yaml': input,
-            'dict': input
-        }
-    elif input is not None:
-        if 'csv' not in input:
-            input['csv'] = None
-        if 'json' not in input:
-            input['json'] = None
-        if 'yaml' not in input:
-            input['yaml'] = None
-        if 'dict' not in input:
-            input['dict'] = None
-    else:
-        input = {
-            'csv': None,
-            'json': None,
-            'yaml': None,
-            'dict': None
-        }
+    if input is None:
+        return BLANK_FORMAT_CALLABLES.copy()
 
-    return input
+    if not isinstance(input, dict):
+        return dict.fromkeys(BLANK_FORMAT_CALLABLES, input)
+
+    result = BLANK_FORMAT_CALLABLES.copy()
+    result.update(input)
+
+    return result
 
 
 def format_to_tuple(format):
@@ -116,31 +237,22 @@ def format_to_tuple(format):
       or ``dict``.
 
     """
-    csv = None
-    json = None
-    yaml = None
-    dict = None
+    try:
+        return FORMAT_TUPLES[format]
+    except (KeyError, TypeError):
+        pass
 
     try:
-        format = validators.string(format,
-                                   allow_empty = False)
+        format = _validate_string(format,
+                                  allow_empty = False)
     except ValueError:
         raise InvalidFormatError('%s is not a valid format string' % format)
 
-    format = format.lower()
-
-    if format == 'csv':
-        csv = True
-    elif format == 'json':
-        json = True
-    elif format == 'yaml':
-        yaml = True
-    elif format == 'dict':
-        dict = True
-    else:
+    result = FORMAT_TUPLES.get(format.lower())
+    if result is None:
         raise InvalidFormatError('%s is not a valid format string' % format)
 
-    return csv, json, yaml, dict
+    return result
 
 
 def get_class_type_key(class_attribute, value = None):
@@ -165,28 +277,93 @@ def get_class_type_key(class_attribute, value = None):
 
     """
     if class_attribute is not None:
-        try:
-            class_type = class_attribute.type
-        except AttributeError:
-            if value is not None:
-                class_type = type(value)
-            else:
-                class_type = None
-    elif value is not None:
+        cached = _CLASS_ATTRIBUTE_TYPE_KEY_CACHE.get(id(class_attribute))
+        if cached is not None and cached[0]() is class_attribute:
+            class_type_key = cached[1]
+        else:
+            class_type_key = _get_attribute_type_key(class_attribute)
+
+        # Attributes without a SQLAlchemy data type are cached as ``_MISSING``
+        # so that ``class_attribute.type`` is only probed once.
+        if class_type_key is not _MISSING:
+            return class_type_key
+
+    if value is not None:
         class_type = type(value)
     else:
         class_type = None
 
-    if class_type is not None:
+    return _get_type_key(class_type)
+
+
+def _get_attribute_type_key(class_attribute):
+    """Retrieve (and cache) the key for the SQLAlchemy data type of
+    ``class_attribute``.
+
+    :returns: The key to use to find a default serializer or de-serializer, or
+      ``_MISSING`` if ``class_attribute`` does not have a data type.
+    :rtype: :class:`str <python:str>` / ``_MISSING``
+    """
+    class_type = getattr(class_attribute, 'type', _MISSING)
+    if class_type is _MISSING:
+        class_type_key = _MISSING
+    else:
+        class_type_key = _get_type_key(class_type)
+
+        # Columns declared without a type (e.g. foreign keys) start out as
+        # NullType and only receive their real type later on.
+        if isinstance(class_type, NullType):
+            return class_type_key
+
+    attribute_id = id(class_attribute)
+
+    def discard(reference):
+        if _CLASS_ATTRIBUTE_TYPE_KEY_CACHE.get(attribute_id, (None, ))[0] is reference:
+            del _CLASS_ATTRIBUTE_TYPE_KEY_CACHE[attribute_id]
+
+    try:
+        reference = weakref.ref(class_attribute, discard)
+    except TypeError:
+        return class_type_key
+
+    _CLASS_ATTRIBUTE_TYPE_KEY_CACHE[attribute_id] = (reference, class_type_key)
+
+    return class_type_key
+
+
+def _get_type_key(class_type):
+    """Retrieve the key used to look up default (de-)serializers for
+    ``class_type``.
+
+    :param class_type: A SQLAlchemy data type or a Python type.
+
+    :returns: The key to use to find a default serializer or de-serializer.
+    :rtype: :class:`str <python:str>`
+    """
+    if class_type is None:
+        return 'NONE'
+
+    try:
+        return _BUILTIN_TYPE_KEYS.get(class_type) or \
+            _CLASS_TYPE_KEY_CACHE[class_type]
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        class_type_key = getattr(class_type, '__name__', None)
+    except SA_UnsupportedCompilationError:
+        class_type_key = None
+
+    if class_type_key is None:
         try:
-            class_type_key = class_type.__name__
+            class_type_key = str(class_type)
         except (AttributeError, SA_UnsupportedCompilationError):
-            try:
-                class_type_key = str(class_type)
-            except (AttributeError, SA_UnsupportedCompilationError):
-                class_type_key = class_type.__class__.__name__
-    else:
-        class_type_key = 'NONE'
+            class_type_key = class_type.__class__.__name__
+
+    try:
+        _CLASS_TYPE_KEY_CACHE[class_type] = class_type_key
+    except TypeError:
+        pass
 
     return class_type_key
 
@@ -228,19 +405,100 @@ def iterable__to_dict(iterable,
       objects.
     :rtype: :class:`list <python:list>` of objects
 
+    .. note::
+
+      1-dimensional NumPy arrays of bool, int, or float values (whether
+      ``iterable`` itself or nested within it) are converted using
+      ``ndarray.tolist()``, so their items are returned as the equivalent Python
+      scalars (e.g. :class:`int <python:int>` rather than ``numpy.int64``).
+
     :raises InvalidFormatError: if ``format`` is not an acceptable value
     :raises ValueError: if ``iterable`` is not an iterable
 
     """
-    next_nesting = current_nesting + 1
-
-    if format not in ['csv', 'json', 'yaml', 'dict']:
+    if not isinstance(format, basestring) or format not in SUPPORTED_FORMATS:
         raise InvalidFormatError("format '%s' not supported" % format)
 
-    iterable = validators.iterable(iterable,
-                                   allow_empty = True,
-                                   forbid_literals = (str, bytes, dict))
+    # Built-in collections (including InstrumentedList) are known iterables and
+    # would be returned unchanged by the validator.
+    if not isinstance(iterable, _BUILTIN_COLLECTION_TYPES):
+        iterable = _validate_iterable(iterable,
+                                      allow_empty = True,
+                                      forbid_literals = LITERAL_TYPES)
+
+    return _iterable__to_dict(iterable,
+                              format,
+                              max_nesting = max_nesting,
+                              current_nesting = current_nesting,
+                              is_dumping = is_dumping,
+                              config_set = config_set)
+
+
+def _is_numeric_vector(iterable):
+    """Indicate whether ``iterable`` is a 1-dimensional NumPy-style array of
+    bool / int / float values.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    return getattr(iterable, 'ndim', None) == 1 and \
+        getattr(getattr(iterable, 'dtype', None), 'kind', None) in _NUMERIC_DTYPE_KINDS
+
+
+def _get_item_kind(item_type):
+    """Classify ``item_type`` by how :func:`_iterable__to_dict` should handle
+    its instances.
+
+    Like :func:`iter() <python:iter>`, the iteration protocol is looked up on the
+    type rather than the instance.
+
+    :returns: One of the ``_KIND_*`` constants.
+    :rtype: :class:`int <python:int>`
+    """
+    if item_type in SCALAR_TYPES:
+        return _KIND_VALUE
+
+    if hasattr(item_type, '_to_dict'):
+        return _KIND_MODEL
+
+    if item_type is _NONE_TYPE:
+        return _KIND_NONE
+
+    if issubclass(item_type, LITERAL_TYPES):
+        return _KIND_VALUE
+
+    if item_type in _BUILTIN_COLLECTION_TYPES:
+        return _KIND_COLLECTION
 
+    if hasattr(item_type, '__iter__'):
+        return _KIND_ITERABLE
+
+    if hasattr(item_type, '__getitem__'):
+        return _KIND_GETITEM
+
+    return _KIND_VALUE
+
+
+def _iterable__to_dict(iterable,
+                       format,
+                       max_nesting = 0,
+                       current_nesting = 0,
+                       is_dumping = False,
+                       config_set = None):
+    """Traverse an already-validated ``iterable`` and execute ``_to_dict()``
+    where present.
+
+    Accepts the same parameters as :func:`iterable__to_dict`, but assumes that
+    ``format`` has been validated and that ``iterable`` is either an iterable or
+    :obj:`None <python:None>`.
+
+    Nested iterables are traversed using an explicit stack rather than
+    recursion, so deeply-nested input is not bound by the interpreter's
+    recursion limit.
+
+    :returns: Collection of values, possibly converted to :class:`dict <python:dict>`
+      objects.
+    :rtype: :class:`list <python:list>` of objects
+    """
     if iterable is None:
         return []
 
@@ -250,29 +508,101 @@ def iterable__to_dict(iterable,
                                                                max_nesting)
         )
 
-    items = []
+    if _is_numeric_vector(iterable):
+        return iterable.tolist()
+
+    # Homogeneous sequences of scalars or models (e.g. relationship collections)
+    # are converted in a single C-level pass, which also sizes the result list
+    # up front rather than growing it one append at a time. The first item's
+    # type decides whether the fast path applies, and the check for the
+    # remaining items stops at the first mismatch.
+    if isinstance(iterable, _SEQUENCE_TYPES) and iterable:
+        item_type = type(iterable[0])
+        is_scalar = item_type in SCALAR_TYPES
+        if (is_scalar or hasattr(item_type, '_to_dict')) and \
+           all(map(operator.is_, map(type, iterable), itertools.repeat(item_type))):
+            if is_scalar:
+                return list(iterable)
+
+            return list(map(operator.methodcaller('_to_dict',
+                                                  format,
+                                                  max_nesting = max_nesting,
+                                                  current_nesting = current_nesting + 1,
+                                                  is_dumping = is_dumping,
+                                                  config_set = config_set),
+                            iterable))
+
+    # Module globals are bound locally so the inner loop uses fast local loads.
+    scalar_types = SCALAR_TYPES
+
+    # How each item type is handled, resolved once per type.
+    kinds = {}
+    dispatchers = {}
+    result = []
+    stack = [(iter(iterable), result, current_nesting + 1)]
+
+    while stack:
+        iterator, items, next_nesting = stack[-1]
+        append = items.append
+        for item in iterator:
+            item_type = type(item)
+            if item_type in scalar_types:
+                append(item)
+                continue
 
-    for item in iterable:
-        try:
-            new_item = item._to_dict(format,
-                                     max_nesting = max_nesting,
-                                     current_nesting = next_nesting,
-                                     is_dumping = is_dumping,
-                                     config_set = config_set)
-        except AttributeError:
-            try:
-                new_item = iterable__to_dict(item,
-                                             format,
-                                             max_nesting = max_nesting,
-                                             current_nesting = next_nesting,
-                                             is_dumping = is_dumping,
-                                             config_set = config_set)
-            except NotAnIterableError:
-                new_item = item
+            kind = kinds.get(item_type)
+            if kind is None:
+                kind = kinds[item_type] = _get_item_kind(item_type)
+
+            if kind == _KIND_VALUE:
+                append(item)
+                continue
+
+            if kind == _KIND_MODEL:
+                to_dict = dispatchers.get(next_nesting)
+                if to_dict is None:
+                    to_dict = operator.methodcaller('_to_dict',
+                                                    format,
+                                                    max_nesting = max_nesting,
+                                                    current_nesting = next_nesting,
+                                                    is_dumping = is_dumping,
+                                                    config_set = config_set)
+                    dispatchers[next_nesting] = to_dict
+                append(to_dict(item))
+                continue
+
+            if kind == _KIND_NONE:
+                append([])
+                continue
+
+            if kind == _KIND_GETITEM:
+                try:
+                    child_iterator = iter(item)
+                except TypeError:
+                    append(item)
+                    continue
+
+            if next_nesting > max_nesting:
+                raise MaximumNestingExceededError(
+                    'current nesting level (%s) exceeds maximum %s' % (next_nesting,
+                                                                       max_nesting)
+                )
 
-        items.append(new_item)
+            if kind == _KIND_ITERABLE and _is_numeric_vector(item):
+                append(item.tolist())
+                continue
+
+            if kind != _KIND_GETITEM:
+                child_iterator = iter(item)
 
-    return items
+            child_items = []
+            append(child_items)
+            stack.append((child_iterator, child_items, next_nesting + 1))
+            break
+        else:
+            stack.pop()
+
+    return result
 
 def raise_UnsupportedSerializationError(value):
     raise UnsupportedSerializationError("value '%s' cannot be serialized" % value)
@@ -316,23 +646,47 @@ def are_equivalent(*args, **kwargs):
         return True
 
     first_item = args[0]
+    first_type = type(first_item)
+    first_length = None
+    first_counter = None
+    first_is_scalar = first_type in SCALAR_TYPES
+    all_lists = not first_is_scalar and \
+        isinstance(first_item, _LIST_TYPES) and \
+        all(isinstance(x, _LIST_TYPES) for x in args[1:])
     for item in args[1:]:
-        if not all(isinstance(x, (list, InstrumentedList)) for x in args) and \
-           type(item) != type(first_item):                                      # pylint: disable=C0123
+        if item is first_item:
+            continue
+
+        if not all_lists and type(item) is not first_type:
             return False
 
-        if isinstance(item, dict):
+        if first_is_scalar:
+            if item != first_item:
+                return False
+        elif isinstance(item, dict):
             if not are_dicts_equivalent(item, first_item):
                 return False
-        elif hasattr(item, '__iter__') and not isinstance(item, (str, bytes, dict)):
-            if len(item) != len(first_item):
+        elif hasattr(type(item), '__iter__') and not isinstance(item, LITERAL_TYPES):
+            if first_length is None:
+                first_length = len(first_item)
+            if len(item) != first_length:
+                return False
+
+            # Built-in sequences that compare equal in order (and sets that
+            # compare equal at all) are necessarily equal as multisets, so a
+            # single C-level comparison can skip hashing every member.
+            if isinstance(item, _BUILTIN_COLLECTION_TYPES) and item == first_item:
+                continue
+
+            try:
+                if first_counter is None:
+                    first_counter = Counter(first_item)
+                is_match = Counter(item) == first_counter
+            except TypeError:
+                is_match = _are_unhashable_members_equivalent(item, first_item)
+
+            if not is_match:
                 return False
-            for value in item:
-                if value not in first_item:
-                    return False
-            for value in first_item:
-                if value not in item:
-                    return False
         else:
             if item != first_item:
                 return False
@@ -340,6 +694,37 @@ def are_equivalent(*args, **kwargs):
     return True
 
 
+def _are_unhashable_members_equivalent(item, first_item):
+    """Indicate whether two equal-length iterables hold the same members, with
+    the same multiplicity, in any order.
+
+    Used by :func:`are_equivalent` when members cannot be hashed.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    values = list(item)
+    remaining = list(first_item)
+
+    # Members that already line up are matched in a single linear pass, so
+    # only the unmatched tail needs the pairwise search.
+    matched = 0
+    for value, other in zip(values, remaining):
+        if not (other is value or other == value):
+            break
+        matched += 1
+
+    del remaining[:matched]
+    for value in values[matched:]:
+        for index, other in enumerate(remaining):
+            if other is value or other == value:
+                del remaining[index]
+                break
+        else:
+            return False
+
+    return not remaining
+
+
 def are_dicts_equivalent(*args, **kwargs):
     """Indicate if :ref:`dicts <python:dict>` passed to this function have identical
     keys and values.
@@ -356,26 +741,33 @@ def are_dicts_equivalent(*args, **kwargs):
     if len(args) == 1:
         return True
 
-    if not all(checkers.is_dict(x) for x in args):
+    first_item = args[0]
+    if not isinstance(first_item, dict):
         return False
 
-    first_item = args[0]
+    first_length = len(first_item)
     for item in args[1:]:
-        if len(item) != len(first_item):
+        if not isinstance(item, dict) or len(item) != first_length:
             return False
 
+        # With equal lengths, every key of ``item`` being in ``first_item``
+        # implies the reverse, so a single pass is sufficient.
         for key in item:
-            if key not in first_item:
-                return False
-
-            if not are_equivalent(item[key], first_item[key]):
+            first_value = first_item.get(key, _MISSING)
+            if first_value is _MISSING:
                 return False
 
-        for key in first_item:
-            if key not in item:
-                return False
+            value = item[key]
+            if value is first_value:
+                continue
 
-            if not are_equivalent(first_item[key], item[key]):
+            # Compare scalar values inline rather than paying for a call to
+            # are_equivalent() for what amounts to a type check and ``!=``.
+            value_type = type(value)
+            if value_type in SCALAR_TYPES:
+                if type(first_value) is not value_type or value != first_value:
+                    return False
+            elif not are_equivalent(value, first_value):
                 return False
 
     return True
@@ -413,16 +805,12 @@ def parse_yaml(input_data,
     :returns: A :class:`dict <python:dict>` representation of ``input_data``.
     :rtype: :class:`dict <python:dict>`
     """
-    is_file = False
-    if checkers.is_file(input_data):
-        is_file = True
+    is_file = _is_file(input_data)
 
-    if deserialize_function is None and not is_file:
-        deserialize_function = yaml.safe_load
-    elif deserialize_function is None and is_file:
-        deserialize_function = yaml.safe_load
+    if deserialize_function is None:
+        deserialize_function = _yaml_safe_load
     else:
-        if checkers.is_callable(deserialize_function) is False:
+        if _is_callable(deserialize_function) is False:
             raise ValueError(
                 'deserialize_function (%s) is not callable' % deserialize_function
             )
@@ -430,21 +818,97 @@ def parse_yaml(input_data,
     if not input_data:
         raise DeserializationError('input_data is empty')
 
-    try:
-        input_data = validators.string(input_data,
-                                       allow_empty = False)
-    except ValueError:
-        raise DeserializationError('input_data is not a valid string')
-
     if not is_file:
-        from_yaml = yaml.safe_load(input_data, **kwargs)
+        if not isinstance(input_data, str_):
+            try:
+                input_data = _validate_string(input_data,
+                                              allow_empty = False)
+            except ValueError:
+                raise DeserializationError('input_data is not a valid string')
+
+        from_yaml = deserialize_function(input_data, **kwargs)
     else:
         with open(input_data, 'r') as input_file:
-            from_yaml = yaml.safe_load(input_file, **kwargs)
+            from_yaml = deserialize_function(input_file, **kwargs)
 
     return from_yaml
 
 
+def _yaml_safe_load(stream, **kwargs):
+    """Equivalent to ``yaml.safe_load()``, but using the libyaml-based loader
+    when it is available."""
+    return yaml.load(stream, Loader = _YamlLoader, **kwargs)
+
+
+# Keys which the YAML emitter always writes as unquoted plain scalars (subject
+# to also resolving as a string, see _yaml_dump_flat()).
+_YAML_PLAIN_KEY = re.compile(r'^[A-Za-z_][A-Za-z0-9_]{0,59}$')
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+_yaml_resolver = yaml.resolver.Resolver()
+
+# The rendering of each value type supported by _yaml_dump_flat().
+_YAML_FLAT_VALUES = {
+    int: str,
+    bool: lambda value: 'true' if value else 'false',
+    _NONE_TYPE: lambda value: 'null',
+}
+
+
+def _yaml_dump_flat(data):
+    """Render a flat :class:`dict <python:dict>` whose keys are identifier-like
+    strings and whose values are :class:`int <python:int>`,
+    :class:`bool <python:bool>`, or :obj:`None <python:None>` as block-style YAML,
+    or return :obj:`None <python:None>` if ``data`` is not such a
+    :class:`dict <python:dict>`."""
+    if type(data) is not dict or not data:
+        return None
+
+    for key, value in data.items():
+        if type(key) is not str \
+           or type(value) not in _YAML_FLAT_VALUES \
+           or not _YAML_PLAIN_KEY.match(key) \
+           or _yaml_resolver.resolve(yaml.ScalarNode,
+                                     key,
+                                     (True, False)) != _YAML_STR_TAG:
+            return None
+
+    return ''.join('%s: %s\n' % (key, _YAML_FLAT_VALUES[type(data[key])](data[key]))
+                   for key in sorted(data))
+
+
+def yaml_dump(data, **kwargs):
+    """Equivalent to ``yaml.dump()``, but using the libyaml-based dumper when it
+    is available and no other ``Dumper`` is requested.
+
+    The libyaml emitter does not always produce byte-identical output to the
+    pure-Python ``yaml.Dumper``, although both load back to the same data. For
+    example, an empty string key is written as ``'': 1`` rather than as the
+    explicit ``? ''`` / ``: 1`` form.
+
+    When called without ``kwargs`` on a flat :class:`dict <python:dict>` whose
+    keys are identifier-like strings and whose values are all integers, booleans,
+    or :obj:`None <python:None>`, the (identical) output is rendered directly
+    rather than through PyYAML's representers. Anything else is passed to
+    ``yaml.dump()``.
+
+    :param data: The data to serialize.
+
+    :param kwargs: Optional keyword arguments that are passed to ``yaml.dump()``.
+    :type kwargs: keyword arguments
+
+    :returns: The YAML representation of ``data``.
+    :rtype: :class:`str <python:str>`
+    """
+    if not kwargs:
+        as_yaml = _yaml_dump_flat(data)
+        if as_yaml is not None:
+            return as_yaml
+
+    kwargs.setdefault('Dumper', _YamlDumper)
+
+    return yaml.dump(data, **kwargs)
+
+
 def parse_json(input_data,
                deserialize_function = None,
                **kwargs):
@@ -458,6 +922,14 @@ def parse_json(input_data,
       :ref:`simplejson.loads() <simplejson:simplejson.loads>`
       function from the `simplejson <https://github.com/simplejson/simplejson>`_ library.
 
+      .. tip::
+
+        If `orjson <https://github.com/ijl/orjson>`_ is installed and no
+        ``kwargs`` are supplied, JSON strings and files are first parsed using
+        ``orjson.loads()``, falling back to the default deserializer for
+        input ``orjson`` cannot handle identically (e.g. ``NaN`` or integers
+        larger than 64 bits).
+
       .. note::
 
         Use the ``deserialize_function`` parameter to override the default
@@ -479,16 +951,16 @@ def parse_json(input_data,
     :returns: A :class:`dict <python:dict>` representation of ``input_data``.
     :rtype: :class:`dict <python:dict>`
     """
-    is_file = False
-    if checkers.is_file(input_data):
-        is_file = True
+    is_file = _is_file(input_data)
+
+    use_orjson = deserialize_function is None and orjson is not None and not kwargs
 
     if deserialize_function is None and not is_file:
         deserialize_function = json.loads
     elif deserialize_function is None and is_file:
         deserialize_function = json.load
     else:
-        if checkers.is_callable(deserialize_function) is False:
+        if _is_callable(deserialize_function) is False:
             raise ValueError(
                 'deserialize_function (%s) is not callable' % deserialize_function
             )
@@ -497,13 +969,26 @@ def parse_json(input_data,
         raise DeserializationError('input_data is empty')
 
     if not is_file:
-        try:
-            input_data = validators.string(input_data,
-                                           allow_empty = False)
-        except ValueError:
-            raise DeserializationError('input_data is not a valid string')
+        if not isinstance(input_data, str_):
+            try:
+                input_data = _validate_string(input_data,
+                                              allow_empty = False)
+            except ValueError:
+                raise DeserializationError('input_data is not a valid string')
+
+        if use_orjson:
+            from_json = _orjson_loads(input_data)
+            if from_json is not _MISSING:
+                return from_json
 
         from_json = deserialize_function(input_data, **kwargs)
+    elif use_orjson:
+        with open(input_data, 'r') as input_file:
+            input_data = input_file.read()
+
+        from_json = _orjson_loads(input_data)
+        if from_json is _MISSING:
+            from_json = json.loads(input_data)
     else:
         with open(input_data, 'r') as input_file:
             from_json = deserialize_function(input_file, **kwargs)
@@ -511,6 +996,80 @@ def parse_json(input_data,
     return from_json
 
 
+def _orjson_loads(input_data):
+    """De-serialize the JSON string ``input_data`` using ``orjson``.
+
+    Input that ``orjson`` rejects (e.g. ``NaN``, or integers wider than 64 bits)
+    is left to the default deserializer. Only where the installed ``orjson``
+    converts such integers to :class:`float <python:float>` without raising is
+    ``input_data`` first scanned for long runs of digits.
+
+    :returns: The de-serialized value, or ``_MISSING`` if ``orjson`` cannot
+      produce the same result as the default JSON deserializer.
+    """
+    if _LONG_DIGIT_RUN is not None and _LONG_DIGIT_RUN.search(input_data):
+        return _MISSING
+
+    try:
+        return orjson.loads(input_data)
+    except orjson.JSONDecodeError:
+        return _MISSING
+
+
+def get_csv_format_params(delimiter,
+                          wrap_all_strings,
+                          wrapper_character,
+                          double_wrapper_character_when_nested,
+                          escape_character,
+                          line_terminator):
+    """Return the :mod:`csv <python:csv>` formatting parameters for a reader or
+    writer.
+
+    The parameters are passed directly to :func:`csv.writer() <python:csv.writer>`
+    or :class:`csv.DictReader <python:csv.DictReader>` rather than registered as a
+    named dialect, which avoids mutating the process-wide dialect registry on every
+    call.
+
+    :param delimiter: The delimiter used between columns.
+    :type delimiter: :class:`str <python:str>`
+
+    :param wrap_all_strings: If ``True``, all non-numeric values are wrapped in
+      ``wrapper_character``. Otherwise, values are only wrapped when necessary.
+    :type wrap_all_strings: :class:`bool <python:bool>`
+
+    :param wrapper_character: The string used to wrap string values. If empty,
+      defaults to a single quote (``'``).
+    :type wrapper_character: :class:`str <python:str>`
+
+    :param double_wrapper_character_when_nested: If ``True``, a
+      ``wrapper_character`` inside a wrapped value is doubled rather than escaped.
+    :type double_wrapper_character_when_nested: :class:`bool <python:bool>`
+
+    :param escape_character: The character used to escape special characters.
+    :type escape_character: :class:`str <python:str>`
+
+    :param line_terminator: The string used to terminate lines.
+    :type line_terminator: :class:`str <python:str>`
+
+    :returns: Keyword arguments for :func:`csv.writer() <python:csv.writer>` or
+      :class:`csv.DictReader <python:csv.DictReader>`.
+    :rtype: :class:`dict <python:dict>`
+    """
+    if wrap_all_strings:
+        quoting = csv.QUOTE_NONNUMERIC
+    else:
+        quoting = csv.QUOTE_MINIMAL
+
+    return {
+        'delimiter': delimiter,
+        'doublequote': double_wrapper_character_when_nested,
+        'escapechar': escape_character,
+        'quotechar': wrapper_character or '\'',
+        'quoting': quoting,
+        'lineterminator': line_terminator
+    }
+
+
 def parse_csv(input_data,
               delimiter = '|',
               wrap_all_strings = False,
@@ -530,8 +1089,10 @@ def parse_csv(input_data,
 
     :param input_data: The CSV data to de-serialize. Should include column headers
       and at least **one** row of data. Will ignore any rows of data beyond the
-      first row.
-    :type input_data: :class:`str <python:str>`
+      first row. May be a single (multi-line) string, an iterable of lines, or the
+      path to a file.
+    :type input_data: :class:`str <python:str>` / iterable of
+      :class:`str <python:str>` / Path-like object
 
     :param delimiter: The delimiter used between columns. Defaults to ``|``.
     :type delimiter: :class:`str <python:str>`
@@ -553,64 +1114,49 @@ def parse_csv(input_data,
       or if column headers are not valid Python variable names
 
     """
-    use_file = False
-    if not checkers.is_file(input_data) and not checkers.is_iterable(input_data):
+    use_file = _is_file(input_data)
+    if not use_file and not _is_iterable(input_data):
         try:
-            input_data = validators.string(input_data, allow_empty = False)
+            input_data = _validate_string(input_data, allow_empty = False)
         except (ValueError, TypeError):
             raise DeserializationError("input_data expects a 'str', received '%s'" \
                                        % type(input_data))
 
-        input_data = [input_data]
-    elif checkers.is_file(input_data):
-        use_file = True
+        # Let the C reader split the lines itself, handling any line terminator.
+        input_data = StringIO(input_data)
 
-    if not wrapper_character:
-        wrapper_character = '\''
-
-    if wrap_all_strings:
-        quoting = csv.QUOTE_NONNUMERIC
-    else:
-        quoting = csv.QUOTE_MINIMAL
-
-    if 'sqlathanor' in csv.list_dialects():
-        csv.unregister_dialect('sqlathanor')
-
-    csv.register_dialect('sqlathanor',
-                         delimiter = delimiter,
-                         doublequote = double_wrapper_character_when_nested,
-                         escapechar = escape_character,
-                         quotechar = wrapper_character,
-                         quoting = quoting,
-                         lineterminator = line_terminator)
+    format_params = get_csv_format_params(delimiter,
+                                          wrap_all_strings,
+                                          wrapper_character,
+                                          double_wrapper_character_when_nested,
+                                          escape_character,
+                                          line_terminator)
 
     if not use_file:
         csv_reader = csv.DictReader(input_data,
-                                    dialect = 'sqlathanor',
                                     restkey = None,
-                                    restval = None)
-        rows = [x for x in csv_reader]
+                                    restval = None,
+                                    **format_params)
+        data = next(csv_reader, None)
     else:
         if not is_py2:
             with open(input_data, 'r', newline = '') as input_file:
                 csv_reader = csv.DictReader(input_file,
-                                            dialect = 'sqlathanor',
                                             restkey = None,
-                                            restval = None)
-                rows = [x for x in csv_reader]
+                                            restval = None,
+                                            **format_params)
+                data = next(csv_reader, None)
         else:
             with open(input_data, 'r') as input_file:
                 csv_reader = csv.DictReader(input_file,
-                                            dialect = 'sqlathanor',
                                             restkey = None,
-                                            restval = None)
+                                            restval = None,
+                                            **format_params)
 
-                rows = [x for x in csv_reader]
+                data = next(csv_reader, None)
 
-    if len(rows) < 1:
+    if data is None:
         raise CSVStructureError('expected 1 row of data and 1 header row, missing 1')
-    else:
-        data = rows[0]
 
     for key in data:
         try:
@@ -623,11 +1169,272 @@ def parse_csv(input_data,
         if data[key] == null_text:
             data[key] = None
 
-    csv.unregister_dialect('sqlathanor')
-
     return data
 
 
+def _filter_attribute_names(names,
+                            include_private = False,
+                            include_special = False,
+                            include_utilities = False):
+    """Filter ``names`` based on their naming conventions alone.
+
+    :returns: The names that survive filtering, in the order they were supplied.
+    :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+    """
+    filtered = []
+    for name in names:
+        if not include_utilities and name in UTILITY_COLUMNS:
+            continue
+
+        if (name[0] == '_' and name[0:2] != '__') and not include_private:
+            continue
+
+        if name[0:2] == '__' and not include_special:
+            continue
+
+        filtered.append(name)
+
+    return filtered
+
+
+def bump_class_version(cls):
+    """Record that an attribute has been set on or deleted from ``cls``.
+
+    Metaclasses call this from ``__setattr__`` / ``__delattr__`` (and once when
+    the class is created) so that the attribute names cached for ``cls`` and
+    its subclasses can be validated by a version number rather than by
+    inspecting the class namespace (see :func:`_get_class_cache`).
+
+    :param cls: The class whose attributes have changed.
+    :type cls: :class:`type <python:type>`
+    """
+    _CLASS_VERSIONS[cls] = _CLASS_VERSIONS.get(cls, 0) + 1
+
+
+def _get_class_signature(cls):
+    """Return a value that changes whenever an attribute is added to, removed
+    from, or rebound on any class in the MRO of ``cls``.
+
+    Classes whose metaclass calls :func:`bump_class_version` contribute their
+    version number, and built-in types (which cannot be modified) contribute
+    nothing. Any other class contributes its attribute names and the types of
+    their values, which are all that the cached names depend on.
+
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    signature = []
+    for base in cls.__mro__:
+        version = _CLASS_VERSIONS.get(base)
+        if version is not None:
+            signature.append(version)
+        elif base.__flags__ & _HEAPTYPE_FLAG:
+            namespace = base.__dict__
+            signature.append(tuple(namespace))
+            signature.append(tuple(map(type, namespace.values())))
+
+    return tuple(signature)
+
+
+def _get_class_cache(cls):
+    """Return the attribute name cache for ``cls``.
+
+    The cache is discarded whenever an attribute defined on any class in the MRO
+    is added, removed, or rebound (e.g. when SQLAlchemy adds a ``backref`` during
+    mapper configuration, or a data attribute is replaced by a function). See
+    :func:`_get_class_signature`.
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    signature = _get_class_signature(cls)
+
+    try:
+        cached_signature, cache = _ATTRIBUTE_NAME_CACHE[cls]
+    except KeyError:
+        cached_signature, cache = None, None
+
+    if cached_signature != signature:
+        cache = {}
+        _ATTRIBUTE_NAME_CACHE[cls] = (signature, cache)
+
+    return cache
+
+
+def _get_class_method_names(cls, cache = None):
+    """Return the names that resolve to a function, class method, or static
+    method on ``cls``.
+
+    Such attributes are callable whenever they are looked up through ``cls`` or
+    one of its instances (unless shadowed in the instance's ``__dict__``), so
+    they can be excluded without evaluating them.
+
+    :param cache: The result of :func:`_get_class_cache` for ``cls``, if the
+      caller has already retrieved it. Defaults to ``None``.
+
+    :rtype: :class:`frozenset <python:frozenset>` of :class:`str <python:str>`
+    """
+    if cache is None:
+        cache = _get_class_cache(cls)
+
+    result = cache.get(_METHOD_NAMES_KEY)
+    if result is None:
+        resolved = {}
+        for base in reversed(cls.__mro__):
+            resolved.update(base.__dict__)
+
+        result = frozenset(name for name, value in resolved.items()
+                           if isinstance(value, _METHOD_TYPES))
+        cache[_METHOD_NAMES_KEY] = result
+
+    return result
+
+
+def _get_method_names(obj, cache = None):
+    """Return the names of attributes on ``obj`` that are known to be methods
+    without having to evaluate them.
+
+    :param cache: The result of :func:`_get_class_cache` for the class of
+      ``obj``, if the caller has already retrieved it. Defaults to ``None``.
+
+    :rtype: :class:`frozenset <python:frozenset>` of :class:`str <python:str>`
+    """
+    if not _uses_default_dir(obj):
+        return _EMPTY_FROZENSET
+
+    if isinstance(obj, type):
+        return _get_class_method_names(obj, cache = cache)
+
+    method_names = _get_class_method_names(type(obj), cache = cache)
+    instance_dict = getattr(obj, '__dict__', None)
+    if instance_dict:
+        method_names = method_names.difference(instance_dict)
+
+    return method_names
+
+
+def _get_class_attribute_names(cls,
+                               include_private = False,
+                               include_special = False,
+                               include_utilities = False,
+                               cache = None):
+    """Return the names from ``dir(cls)`` which pass the name-based filters.
+
+    Results are cached per class and per set of flags (see
+    :func:`_get_class_cache`). ``cache`` may be supplied if the caller has
+    already retrieved it.
+
+    :returns: The sorted candidate names, and the same names as a
+      :class:`frozenset <python:frozenset>` for membership tests.
+    :rtype: :class:`tuple <python:tuple>` of (:class:`tuple <python:tuple>`,
+      :class:`frozenset <python:frozenset>`)
+    """
+    if cache is None:
+        cache = _get_class_cache(cls)
+    key = (include_private, include_special, include_utilities)
+
+    result = cache.get(key)
+    if result is None:
+        names = tuple(_filter_attribute_names(dir(cls),
+                                              include_private = include_private,
+                                              include_special = include_special,
+                                              include_utilities = include_utilities))
+        result = (names, frozenset(names))
+        cache[key] = result
+
+    return result
+
+
+def _uses_default_dir(obj):
+    """Indicate whether ``dir(obj)`` is the standard (cacheable) implementation.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    default_dir = getattr(type if isinstance(obj, type) else object, '__dir__', None)
+
+    return getattr(type(obj), '__dir__', None) is default_dir
+
+
+def _get_candidate_attribute_names(obj,
+                                   include_private = False,
+                                   include_special = False,
+                                   include_utilities = False,
+                                   cache = None):
+    """Return the names from ``dir(obj)`` which pass the name-based filters.
+
+    :param cache: The result of :func:`_get_class_cache` for the class of
+      ``obj``, if the caller has already retrieved it. Defaults to ``None``.
+
+    :returns: Candidate attribute names, sorted.
+    :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+    """
+    if not _uses_default_dir(obj):
+        return _filter_attribute_names(dir(obj),
+                                       include_private = include_private,
+                                       include_special = include_special,
+                                       include_utilities = include_utilities)
+
+    is_class = isinstance(obj, type)
+    cls = obj if is_class else type(obj)
+    class_names = _get_class_attribute_names(cls,
+                                             include_private = include_private,
+                                             include_special = include_special,
+                                             include_utilities = include_utilities,
+                                             cache = cache)[0]
+
+    instance_dict = None if is_class else getattr(obj, '__dict__', None)
+    if not instance_dict:
+        return list(class_names)
+
+    instance_names = _filter_attribute_names(instance_dict,
+                                             include_private = include_private,
+                                             include_special = include_special,
+                                             include_utilities = include_utilities)
+
+    return sorted(set(class_names).union(instance_names))
+
+
+def _is_included_attribute(obj,
+                           attribute,
+                           include_callable = False,
+                           include_nested = True):
+    """Indicate whether the value of ``attribute`` on ``obj`` passes the
+    value-based filters applied by :func:`get_attribute_names`.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    try:
+        attribute_value = getattr(obj, attribute)
+    except SA_InvalidRequestError:
+        return include_nested
+
+    # Scalars and None are neither nested nor callable.
+    if attribute_value is None or type(attribute_value) in SCALAR_TYPES:
+        return True
+
+    if not include_nested:
+        if isinstance(attribute_value, dict) or \
+           _is_type(attribute_value, _NESTED_TYPES):
+            return False
+
+        try:
+            is_iterable = _is_iterable(attribute_value,
+                                       forbid_literals = LITERAL_TYPES)
+        except SA_InvalidRequestError:
+            return False
+
+        if is_iterable:
+            try:
+                for item in attribute_value:
+                    if _is_type(item, _NESTED_TYPES):
+                        return False
+            except (NotImplementedError, TypeError):
+                pass
+
+    if not include_callable and _is_callable(attribute_value):
+        return False
+
+    return True
+
+
 def get_attribute_names(obj,
                         include_callable = False,
                         include_nested = True,
@@ -661,67 +1468,26 @@ def get_attribute_names(obj,
     :rtype: :class:`list <python:list>` of :class:`str <python:str>`
 
     """
-    attribute_names = [x for x in dir(obj)
-                       if (include_utilities and x in UTILITY_COLUMNS) or \
-                          (x not in UTILITY_COLUMNS)]
-    attributes = []
-    for attribute in attribute_names:
-        if (attribute[0] == '_' and attribute[0:2] != '__') and not include_private:
-            continue
-
-        if attribute[0:2] == '__' and not include_special:
-            continue
-
-        try:
-            attribute_value = getattr(obj, attribute)
-        except SA_InvalidRequestError:
-            if not include_nested:
-                continue
-
-            attributes.append(attribute)
-            continue
-
-        if not include_nested:
-            if checkers.is_type(attribute_value, ('BaseModel',
-                                                  'RelationshipProperty',
-                                                  'AssociationProxy',
-                                                  dict)):
-                continue
-
-            try:
-                is_iterable = checkers.is_iterable(attribute_value,
-                                                   forbid_literals = (str,
-                                                                      bytes,
-                                                                      dict))
-            except SA_InvalidRequestError as error:
-                if not include_nested:
-                    continue
-                else:
-                    is_iterable = False
-
-            if is_iterable:
-                loop = False
-
-                try:
-                    for item in attribute_value:
-                        if checkers.is_type(item, ('BaseModel',
-                                                   'RelationshipProperty',
-                                                   'AssociationProxy',
-                                                   dict)):
-                            loop = True
-                            break
-                except (NotImplementedError, TypeError):
-                    pass
-
-                if loop:
-                    continue
-
-        if not include_callable and checkers.is_callable(attribute_value):
-            continue
-
-        attributes.append(attribute)
+    cache = None
+    if _uses_default_dir(obj):
+        cache = _get_class_cache(obj if isinstance(obj, type) else type(obj))
+
+    attribute_names = _get_candidate_attribute_names(obj,
+                                                     include_private = include_private,
+                                                     include_special = include_special,
+                                                     include_utilities = include_utilities,
+                                                     cache = cache)
+    if include_callable:
+        method_names = _EMPTY_FROZENSET
+    else:
+        method_names = _get_method_names(obj, cache = cache)
 
-    return attributes
+    return [x for x in attribute_names
+            if x not in method_names and
+            _is_included_attribute(obj,
+                                   x,
+                                   include_callable = include_callable,
+                                   include_nested = include_nested)]
 
 
 def is_an_attribute(obj,
@@ -759,16 +1525,43 @@ def is_an_attribute(obj,
     :rtype: :class:`bool <python:bool>`
 
     """
-    if not hasattr(obj, attribute):
+    if not attribute or not isinstance(attribute, basestring):
         return False
 
-    attributes = get_attribute_names(obj,
-                                     include_callable = include_callable,
-                                     include_nested = include_nested,
-                                     include_private = include_private,
-                                     include_utilities = include_utilities)
+    # Name-based filters need nothing but the name itself, so apply them before
+    # looking at ``obj`` at all.
+    if not _filter_attribute_names((attribute, ),
+                                   include_private = include_private,
+                                   include_utilities = include_utilities):
+        return False
 
-    return attribute in attributes
+    cache = None
+    if not _uses_default_dir(obj):
+        if attribute not in dir(obj):
+            return False
+    else:
+        is_class = isinstance(obj, type)
+        cls = obj if is_class else type(obj)
+        cache = _get_class_cache(cls)
+        class_names = _get_class_attribute_names(cls,
+                                                 include_private = include_private,
+                                                 include_utilities = include_utilities,
+                                                 cache = cache)[1]
+        if attribute not in class_names:
+            instance_dict = None if is_class else getattr(obj, '__dict__', None)
+            if not instance_dict or attribute not in instance_dict:
+                return False
+
+    if not include_callable and attribute in _get_method_names(obj, cache = cache):
+        return False
+
+    try:
+        return _is_included_attribute(obj,
+                                      attribute,
+                                      include_callable = include_callable,
+                                      include_nested = include_nested)
+    except AttributeError:
+        return False
 
 
 def read_csv_data(input_data,
@@ -799,35 +1592,37 @@ def read_csv_data(input_data,
     except AttributeError:
         pass
 
-    original_input_data = input_data
-
-    if checkers.is_file(input_data) and not single_record:
+    is_file = _is_file(input_data)
+    if is_file and not single_record:
         with open(input_data, 'r') as input_file:
             input_data = input_file.read()
-    elif checkers.is_file(input_data) and single_record:
-        input_data = linecache.getline(original_input_data, 2)
-        if input_data == '':
-            input_data = linecache.getline(original_input_data, 1)
-        if input_data == '':
+    elif is_file:
+        with open(input_data, 'r') as input_file:
+            lines = list(itertools.islice(input_file, 2))
+
+        if not lines:
             input_data = None
+        else:
+            input_data = lines[-1]
     elif single_record:
         try:
             if line_terminator in input_data:
-                parsed_data = input_data.split(line_terminator)
+                separator = line_terminator
             elif line_terminator == '\r\n' and '\r' in input_data:
-                parsed_data = input_data.split('\r')
+                separator = '\r'
             elif line_terminator == '\r\n' and '\n' in input_data:
-                parsed_data = input_data.split('\n')
+                separator = '\n'
             else:
-                parsed_data = [input_data]
+                separator = None
         except TypeError:
-            parsed_data = [input_data]
+            separator = None
 
-        if not parsed_data:
-            input_data = None
-        elif len(parsed_data) == 1:
-            input_data = parsed_data[0]
-        else:
-            input_data = parsed_data[1]
+        if separator is not None:
+            start = input_data.find(separator) + len(separator)
+            end = input_data.find(separator, start)
+            if end == -1:
+                input_data = input_data[start:]
+            else:
+                input_data = input_data[start:end]
 
     return input_data
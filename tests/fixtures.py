@@ -16,9 +16,11 @@ import pytest
 
 from sqlathanor import BaseModel as Base
 from sqlathanor import Column, relationship, AttributeConfiguration
+from sqlathanor.automap import automap_base
 
 from sqlalchemy import Integer, String, Interval, ForeignKey, create_engine, MetaData, Table
-from sqlalchemy.orm import clear_mappers, Session, backref
+from sqlalchemy.orm import clear_mappers, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -58,11 +60,13 @@ def state(request):
 
 @pytest.fixture(scope = "session")
 def db_engine(request):
-    engine = create_engine('sqlite://')
+    engine = create_engine('sqlite://',
+                           connect_args = {'check_same_thread': False},
+                           poolclass = StaticPool)
 
     return engine
 
-@pytest.yield_fixture(scope = 'session')
+@pytest.fixture(scope = 'session')
 def tables(request, db_engine):
     BaseModel = declarative_base(cls = Base, metadata = MetaData())
 
@@ -76,7 +80,9 @@ def tables(request, db_engine):
                     primary_key = True)
         name = Column('username',
                       String(50))
-        addresses = relationship('Address', backref = 'user')
+        addresses = relationship('Address',
+                                 back_populates = 'user',
+                                 lazy = 'selectin')
 
         _hybrid = 1
 
@@ -96,7 +102,12 @@ def tables(request, db_engine):
         def hybrid_differentiated(self, value):
             self._hybrid = value
 
-        keywords_basic = association_proxy('keywords_basic', 'keyword')
+        user_keywords = relationship('UserKeyword',
+                                     back_populates = 'user',
+                                     cascade = 'all, delete-orphan',
+                                     lazy = 'selectin')
+
+        keywords_basic = association_proxy('user_keywords', 'keyword')
 
     class Address(BaseModel):
         """Mocked class with a single primary key."""
@@ -112,6 +123,10 @@ def tables(request, db_engine):
                          Integer,
                          ForeignKey('users.id'))
 
+        user = relationship('User',
+                            back_populates = 'addresses',
+                            lazy = 'selectin')
+
     class User2(BaseModel):
         """Mocked class with a single primary key."""
 
@@ -128,7 +143,9 @@ def tables(request, db_engine):
                      primary_key = True)
         name = Column('username',
                       String(50))
-        addresses = relationship('Address2', backref = 'user')
+        addresses = relationship('Address2',
+                                 back_populates = 'user',
+                                 lazy = 'selectin')
 
         _hybrid = 1
         @hybrid_property
@@ -153,6 +170,10 @@ def tables(request, db_engine):
                          Integer,
                          ForeignKey('users_composite.id'))
 
+        user = relationship('User2',
+                            back_populates = 'addresses',
+                            lazy = 'selectin')
+
     class User_Complex(BaseModel):
         """Mocked class with a single primary key with varied serialization support."""
 
@@ -184,7 +205,8 @@ def tables(request, db_engine):
                         String(50))
 
         addresses = relationship('Address_Complex',
-                                 backref = 'user',
+                                 back_populates = 'user',
+                                 lazy = 'selectin',
                                  supports_json = True,
                                  supports_yaml = (True, True),
                                  supports_dict = (True, False))
@@ -210,6 +232,11 @@ def tables(request, db_engine):
         #keywords_basic = association_proxy('keywords_basic',
         #                                   'keyword')
 
+        keywords_basic = relationship('UserKeyword_Complex',
+                                      back_populates = 'user',
+                                      cascade = 'all, delete-orphan',
+                                      lazy = 'selectin')
+
     class UserKeyword(BaseModel):
         __tablename__ = 'user_keywords'
 
@@ -224,10 +251,10 @@ def tables(request, db_engine):
         special_key = Column('special_key', String(50))
 
         user = relationship(User,
-                            backref = backref('keywords_basic',
-                                              cascade = 'all, delete-orphan'))
+                            back_populates = 'user_keywords',
+                            lazy = 'selectin')
 
-        keyword = relationship('Keyword')
+        keyword = relationship('Keyword', lazy = 'selectin')
 
         def __init__(self, keyword = None, user = None, special_key = None):
             self.user = user
@@ -248,9 +275,9 @@ def tables(request, db_engine):
         special_key = Column('special_key', String(50))
 
         user = relationship(User_Complex,
-                            backref = backref('keywords_basic',
-                                              cascade = 'all, delete-orphan'))
-        keyword = relationship('Keyword')
+                            back_populates = 'keywords_basic',
+                            lazy = 'selectin')
+        keyword = relationship('Keyword', lazy = 'selectin')
 
         def __init__(self, keyword = None, user = None, special_key = None):
             self.user = user
@@ -291,6 +318,10 @@ def tables(request, db_engine):
                          Integer,
                          ForeignKey('users_complex.id'))
 
+        user = relationship('User_Complex',
+                            back_populates = 'addresses',
+                            lazy = 'selectin')
+
     class User_Complex_Meta(BaseModel):
         """Mocked class with a single primary key."""
 
@@ -333,7 +364,7 @@ def tables(request, db_engine):
                     primary_key = True)
         name = Column('username',
                       String(50))
-        addresses = relationship('Address_Complex_Meta', backref = 'user')
+        addresses = relationship('Address_Complex_Meta', back_populates = 'user')
 
         password = Column('password',
                           String(50))
@@ -380,6 +411,8 @@ def tables(request, db_engine):
                          Integer,
                          ForeignKey('users_complex_meta.id'))
 
+        user = relationship('User_Complex_Meta', back_populates = 'addresses')
+
 
     class User_Complex_PostgreSQL(BaseModel):
         """Mocked class with a single primary key."""
@@ -429,7 +462,7 @@ def tables(request, db_engine):
                     primary_key = True)
         name = Column('username',
                       String(50))
-        addresses = relationship('Address_Complex_PostgreSQL', backref = 'user')
+        addresses = relationship('Address_Complex_PostgreSQL', back_populates = 'user')
 
         password = Column('password',
                           String(50))
@@ -484,6 +517,8 @@ def tables(request, db_engine):
                          Integer,
                          ForeignKey('users_complex_postgresql.id'))
 
+        user = relationship('User_Complex_PostgreSQL', back_populates = 'addresses')
+
 
     # ISSUE 87: One-to-One relationship deserialization
     class User_OneToOne_Nested(BaseModel):
@@ -517,7 +552,9 @@ def tables(request, db_engine):
                     primary_key = True)
         name = Column('username',
                       String(50))
-        address = relationship('Address_Nested_OneToOne', backref = 'user', uselist = False)
+        address = relationship('Address_Nested_OneToOne',
+                               back_populates = 'user',
+                               uselist = False)
 
     class Address_Nested_OneToOne(BaseModel):
         """Mocked class with a single primary key."""
@@ -556,6 +593,8 @@ def tables(request, db_engine):
                          Integer,
                          ForeignKey('users_one_to_one.id'))
 
+        user = relationship('User_OneToOne_Nested', back_populates = 'address')
+
     BaseModel.metadata.create_all(db_engine)
 
     yield {
@@ -572,16 +611,51 @@ def tables(request, db_engine):
     BaseModel.metadata.drop_all(db_engine)
     BaseModel.metadata.clear()
 
-@pytest.yield_fixture(scope = 'session')
+@pytest.fixture(scope = 'session')
 def base_model(request, tables):
     BaseModel = tables['base_model']
 
     yield BaseModel
 
 
-@pytest.yield_fixture
-def db_session(request, db_engine, base_model):
+@pytest.fixture(scope = 'session')
+def db_connection(request, db_engine):
     connection = db_engine.connect()
+
+    yield connection
+
+    connection.close()
+
+
+@pytest.fixture
+def db_session(request, db_connection, base_model):
+    # The connection lives for the whole session; only the transaction is
+    # per-test. A SAVEPOINT inside one long-lived outer transaction would be
+    # released (not discarded) by a test's ``session.commit()``, leaking rows
+    # into later tests, so the outer transaction is what gets rolled back.
+    transaction = db_connection.begin()
+    session = Session(bind = db_connection)
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+
+@pytest.fixture(scope = 'module')
+def relationship_engine(request, relationship_base):
+    """Return an in-memory engine holding the schema of ``relationship_base``,
+    which the requesting test module must supply as a fixture."""
+    engine = create_engine('sqlite:///',
+                           connect_args = {'check_same_thread': False},
+                           poolclass = StaticPool)
+    relationship_base.metadata.create_all(engine)
+
+    return engine
+
+
+@pytest.fixture
+def relationship_session(request, relationship_engine):
+    connection = relationship_engine.connect()
     transaction = connection.begin()
     session = Session(bind = connection)
 
@@ -591,15 +665,13 @@ def db_session(request, db_engine, base_model):
     transaction.rollback()
     connection.close()
 
-@pytest.fixture()
-def model_single_pk(request, tables):
-    User = tables['model_single_pk'][0]
-    Address = tables['model_single_pk'][1]
 
-    return (User, Address)
+@pytest.fixture(scope = 'session')
+def model_single_pk(request, tables):
+    return tables['model_single_pk']
 
 
-@pytest.fixture()
+@pytest.fixture(scope = 'session')
 def model_reflected_tables(request, db_engine, tables):
     BaseModel = tables['base_model']
 
@@ -628,12 +700,16 @@ def model_reflected_tables(request, db_engine, tables):
             User_Complex_Meta_Reflected_Meta)
 
 
+SINGLE_PK_VALUES = {
+    'id': 1,
+    'name': 'Test Name'
+}
+
 @pytest.fixture()
 def instance_single_pk(request, model_single_pk):
-    instance_values = {
-        'id': 1,
-        'name': 'Test Name'
-    }
+    # ORM instances cannot be shallow-copied (the copy would share the
+    # original's instance state), so a fresh instance is built per test.
+    instance_values = dict(SINGLE_PK_VALUES)
     user = model_single_pk[0]
 
     instance = user(**instance_values)
@@ -643,20 +719,19 @@ def instance_single_pk(request, model_single_pk):
 
 @pytest.fixture(scope = 'session')
 def model_composite_pk(request, tables):
-    User2 = tables['model_composite_pk'][0]
-    Address2 = tables['model_composite_pk'][1]
+    return tables['model_composite_pk']
 
-    return (User2, Address2)
 
+COMPOSITE_PK_VALUES = {
+    'id': 1,
+    'id2': 2,
+    'id3': 3,
+    'name': 'Test Name'
+}
 
 @pytest.fixture
 def instance_composite_pk(request, model_composite_pk):
-    instance_values = {
-        'id': 1,
-        'id2': 2,
-        'id3': 3,
-        'name': 'Test Name'
-    }
+    instance_values = dict(COMPOSITE_PK_VALUES)
     user = model_composite_pk[0]
 
     instance = user(**instance_values)
@@ -666,47 +741,39 @@ def instance_composite_pk(request, model_composite_pk):
 
 @pytest.fixture(scope = 'session')
 def model_complex(request, tables):
-    User = tables['model_complex'][0]
-    Address = tables['model_complex'][1]
-
-    return (User, Address)
+    return tables['model_complex']
 
 @pytest.fixture(scope = 'session')
 def model_complex_meta(request, tables):
-    User = tables['model_complex_meta'][0]
-    Address = tables['model_complex_meta'][1]
-
-    return (User, Address)
+    return tables['model_complex_meta']
 
 
 @pytest.fixture(scope = 'session')
 def model_complex_postgresql(request, tables):
-    User2 = tables['model_complex_postgresql'][0]
-    Address2 = tables['model_complex_postgresql'][1]
-
-    return (User2, Address2)
+    return tables['model_complex_postgresql']
 
 @pytest.fixture(scope = 'session')
 def model_nested_one_to_one(request, tables):
-    User3 = tables['model_user_one_to_one'][0]
-    Address3 = tables['model_user_one_to_one'][1]
+    return tables['model_user_one_to_one']
 
-    return (User3, Address3)
 
+COMPLEX_USER_VALUES = {
+    'id': 1,
+    'name': 'test_username',
+    'password': 'test_password',
+    'hidden': 'hidden value'
+}
+
+COMPLEX_ADDRESS_VALUES = {
+    'id': 1,
+    'email': 'test@domain.com',
+    'user_id': 1
+}
 
 @pytest.fixture
 def instance_complex(request, model_complex):
-    user_instance_values = {
-        'id': 1,
-        'name': 'test_username',
-        'password': 'test_password',
-        'hidden': 'hidden value'
-    }
-    address_instance_values = {
-        'id': 1,
-        'email': 'test@domain.com',
-        'user_id': 1
-    }
+    user_instance_values = dict(COMPLEX_USER_VALUES)
+    address_instance_values = dict(COMPLEX_ADDRESS_VALUES)
     user = model_complex[0]
     address = model_complex[1]
 
@@ -721,17 +788,8 @@ def instance_complex(request, model_complex):
 
 @pytest.fixture
 def instance_complex_meta(request, model_complex_meta):
-    user_instance_values = {
-        'id': 1,
-        'name': 'test_username',
-        'password': 'test_password',
-        'hidden': 'hidden value'
-    }
-    address_instance_values = {
-        'id': 1,
-        'email': 'test@domain.com',
-        'user_id': 1
-    }
+    user_instance_values = dict(COMPLEX_USER_VALUES)
+    address_instance_values = dict(COMPLEX_ADDRESS_VALUES)
     user = model_complex_meta[0]
     address = model_complex_meta[1]
 
@@ -744,21 +802,14 @@ def instance_complex_meta(request, model_complex_meta):
     return (instances, instance_values)
 
 
+POSTGRESQL_USER_VALUES = dict(COMPLEX_USER_VALUES,
+                              smallint_column = 2,
+                              time_delta = datetime.timedelta(1))
+
 @pytest.fixture
 def instance_postgresql(request, model_complex_postgresql):
-    user_instance_values = {
-        'id': 1,
-        'name': 'test_username',
-        'password': 'test_password',
-        'hidden': 'hidden value',
-        'smallint_column': 2,
-        'time_delta': datetime.timedelta(1)
-    }
-    address_instance_values = {
-        'id': 1,
-        'email': 'test@domain.com',
-        'user_id': 1
-    }
+    user_instance_values = dict(POSTGRESQL_USER_VALUES)
+    address_instance_values = dict(COMPLEX_ADDRESS_VALUES)
     user = model_complex_postgresql[0]
     address = model_complex_postgresql[1]
 
@@ -776,11 +827,7 @@ def instance_nested_one_to_one(request, model_nested_one_to_one):
         'id': 1,
         'name': 'test_username'
     }
-    address_instance_values = {
-        'id': 1,
-        'email': 'test@domain.com',
-        'user_id': 1
-    }
+    address_instance_values = dict(COMPLEX_ADDRESS_VALUES)
 
     user = model_nested_one_to_one[0]
     address = model_nested_one_to_one[1]
@@ -1091,6 +1138,9 @@ def existing_db(request, tmpdir_factory):
 
     cursor = connection.cursor()
 
+    # The database is a throwaway test fixture, so skip the fsync on each commit.
+    cursor.execute('PRAGMA synchronous = OFF')
+
     cursor.execute('''CREATE TABLE users
                    (id INT PRIMARY KEY, col1 TEXT, col2 TEXT, col3 TEXT)'''
                   )
@@ -1098,8 +1148,6 @@ def existing_db(request, tmpdir_factory):
                    (id INT PRIMARY KEY, col1 TEXT, col2 TEXT)'''
                   )
 
-    connection.commit()
-
     users = [(1, 'row1test1', 'row1test2', 'row1test3'),
              (2, 'row2test1', 'row1test2', 'row2test3')]
     addresses = [(1, 'row1test1', 'row1test2'),
@@ -1114,6 +1162,22 @@ def existing_db(request, tmpdir_factory):
     return db_filename
 
 
+@pytest.fixture(scope = 'session')
+def automap_base_prepared(request, existing_db):
+    """Return an automap base reflected from ``existing_db``.
+
+    Reflection runs once per session. Tests that modify the generated classes
+    should map a fresh ``automap_base(metadata = ...)`` over this base's
+    (already-reflected) ``metadata`` instead."""
+    Base = automap_base()
+
+    engine = create_engine('sqlite:///%s' % existing_db)
+    Base.prepare(engine, reflect = True)
+    engine.dispose()
+
+    return Base
+
+
 @pytest.fixture
 def input_files(request):
     """Return the ``--inputs`` command-line option."""
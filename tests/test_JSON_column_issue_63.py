@@ -23,7 +23,7 @@ except ImportError:
 from sqlalchemy.ext.declarative import declarative_base
 from validator_collection import checkers
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, instance_single_pk, model_complex_postgresql, instance_postgresql
 
 from sqlathanor import BaseModel as Base
@@ -37,7 +37,7 @@ from sqlathanor.errors import CSVStructureError, DeserializationError, \
 from sqlathanor.utilities import are_dicts_equivalent
 
 
-@pytest.fixture
+@pytest.fixture(scope = 'module')
 def model_class(request, db_engine):
     BaseModel = declarative_base(cls = Base, metadata = MetaData())
     if JSON is not None:
@@ -15,6 +15,9 @@ from sqlathanor.attributes import AttributeConfiguration, validate_serialization
     BLANK_ON_SERIALIZE
 from sqlathanor.utilities import bool_to_tuple, callable_to_dict
 
+DEFAULT_SUPPORTS = bool_to_tuple((False, False))
+
+
 @pytest.mark.parametrize('kwargs', [
     (None),
     ({
@@ -58,24 +61,18 @@ def test_AttributeConfiguration__init__(kwargs):
 
     assert result.name == kwargs.get('name', None)
     assert result.display_name == kwargs.get('display_name', None)
-    assert result.supports_csv == bool_to_tuple(kwargs.get('supports_csv',
-                                                           (False, False)))
     assert result.csv_sequence == kwargs.get('csv_sequence', None)
-    assert result.supports_json == bool_to_tuple(kwargs.get('supports_json',
-                                                            (False, False)))
-    assert result.supports_yaml == bool_to_tuple(kwargs.get('supports_yaml',
-                                                            (False, False)))
-    assert result.supports_dict == bool_to_tuple(kwargs.get('supports_dict',
-                                                            (False, False)))
+    for key in ('supports_csv', 'supports_json', 'supports_yaml', 'supports_dict'):
+        expected_result = (bool_to_tuple(kwargs[key]) if key in kwargs
+                           else DEFAULT_SUPPORTS)
+        assert getattr(result, key) == expected_result
 
     assert result.on_serialize is not None
     assert isinstance(result.on_serialize, dict)
     input_on_serialize = callable_to_dict(
         kwargs.get('on_serialize', BLANK_ON_SERIALIZE) or BLANK_ON_SERIALIZE
     )
-    for key in result.on_serialize:
-        assert key in input_on_serialize
-        assert result.on_serialize[key] == input_on_serialize[key]
+    assert result.on_serialize == input_on_serialize
 
     assert result.on_deserialize is not None
     assert isinstance(result.on_deserialize, dict)
@@ -84,9 +81,7 @@ def test_AttributeConfiguration__init__(kwargs):
         kwargs.get('on_deserialize', BLANK_ON_SERIALIZE) or BLANK_ON_SERIALIZE
     )
 
-    for key in result.on_deserialize:
-        assert key in input_on_deserialize
-        assert result.on_deserialize[key] == input_on_deserialize[key]
+    assert result.on_deserialize == input_on_deserialize
 
 
 @pytest.mark.parametrize('key, value, expected_result, error', [
@@ -148,16 +143,13 @@ def test_AttributeConfiguration_keys():
 def test_AttributeConfiguration__iterate__():
     config = AttributeConfiguration()
     length = len(config)
-    index = 0
-    for key in config:
-        index += 1
 
-    assert index == length
+    assert sum(1 for _ in config) == length
 
-    assert len(config.values()) == len(config) == len(config.keys()) == index
+    assert len(config.values()) == len(config.keys()) == length
 
 
-@pytest.mark.parametrize('config, expected_length', [
+@pytest.fixture(scope = 'session', params = [
     ([], 0),
     (None, 0),
     (AttributeConfiguration(), 1),
@@ -166,9 +158,37 @@ def test_AttributeConfiguration__iterate__():
     ({ 'name': 'test_1' }, 1),
     ([{ 'name': 'test_2' }, {'name': 'test_3'}], 2),
 ])
-def test_validate_serialization_config(config, expected_length):
-    result = validate_serialization_config(config)
+def validated_serialization_config(request):
+    """Return the result of validating each ``config``, computed once per session,
+    along with its expected length."""
+    config, expected_length = request.param
+
+    return (validate_serialization_config(config), expected_length)
+
+
+def test_validate_serialization_config(validated_serialization_config):
+    result, expected_length = validated_serialization_config
     assert len(result) == expected_length
     if len(result) > 0:
         for item in result:
             assert isinstance(item, AttributeConfiguration)
+
+
+def test_AttributeConfiguration_copy():
+    config = AttributeConfiguration(name = 'test_copy',
+                                    supports_csv = (True, False),
+                                    csv_sequence = 3,
+                                    supports_json = True,
+                                    on_serialize = bool_to_tuple,
+                                    display_name = 'copied')
+    result = config.copy()
+
+    assert result is not config
+    assert isinstance(result, AttributeConfiguration)
+    for key in ('name', 'supports_csv', 'csv_sequence', 'supports_json',
+                'supports_yaml', 'supports_dict', 'on_serialize',
+                'on_deserialize', 'display_name'):
+        assert result[key] == config[key]
+
+    result.on_serialize['csv'] = None
+    assert config.on_serialize['csv'] is bool_to_tuple
@@ -16,18 +16,19 @@ from sqlalchemy.ext.automap import AutomapBase
 from sqlathanor.declarative import BaseModel
 from sqlathanor.automap import automap_base
 
-from tests.fixtures import existing_db
+from tests.fixtures import existing_db, automap_base_prepared
 
 
-def test_automap_base(request, existing_db):
+def test_automap_base(request, existing_db, automap_base_prepared):
 
-    Base = automap_base()
+    Base = automap_base_prepared
 
     engine = create_engine('sqlite:///%s' % existing_db)
     assert len(engine.table_names()) == 2
 
-    Base.prepare(engine, reflect = True)
-
+    assert isinstance(Base, type)
+    assert issubclass(Base, AutomapBase)
+    assert issubclass(Base, BaseModel)
     assert len(Base.classes) == 2
 
     User = Base.classes.users
@@ -55,12 +56,10 @@ def test_automap_base(request, existing_db):
                                              to_dict = True)) == 0
 
 
-def test_set_serialization(request, existing_db):
-
-    Base = automap_base()
+def test_set_serialization(request, automap_base_prepared):
 
-    engine = create_engine('sqlite:///%s' % existing_db)
-    Base.prepare(engine, reflect = True)
+    Base = automap_base(metadata = automap_base_prepared.metadata)
+    Base.prepare()
 
     User = Base.classes.users
     Address = Base.classes.addresses
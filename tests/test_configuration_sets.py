@@ -12,28 +12,28 @@ Tests for the addition of Configuration Set support.
 
 import pytest
 
-
-from sqlalchemy import Integer, Text, create_engine, MetaData, Table
+from sqlalchemy import Integer, Text, MetaData
 from sqlalchemy.ext.declarative import declarative_base
-from validator_collection import checkers
-import yaml
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
-    model_single_pk, instance_single_pk, model_complex_postgresql, instance_postgresql
+from tests.fixtures import db_engine
 
 from sqlathanor import BaseModel as Base
 from sqlathanor import Column, AttributeConfiguration
-from sqlathanor._compat import json
 
-from sqlathanor.errors import CSVStructureError, DeserializationError, \
-    MaximumNestingExceededError, MaximumNestingExceededWarning, \
-    SerializableAttributeError, InvalidFormatError, ValueSerializationError, \
-    ValueDeserializationError, DeserializableAttributeError, DeserializationError, \
-    ExtraKeyError, ConfigurationError
-from sqlathanor.utilities import are_dicts_equivalent, parse_csv, parse_json, parse_yaml
+from sqlathanor.errors import DeserializationError, SerializableAttributeError, \
+    ConfigurationError
+from sqlathanor.utilities import parse_csv, parse_json, parse_yaml
+
+# format: (serialization method name, expected result type, parse function, extra kwargs)
+FORMAT_DISPATCH = {
+    'dict': ('to_dict', dict, None, {}),
+    'json': ('to_json', str, parse_json, {}),
+    'yaml': ('to_yaml', str, parse_yaml, {}),
+    'csv': ('to_csv', str, parse_csv, {'include_header': True}),
+}
 
 
-@pytest.fixture
+@pytest.fixture(scope = 'module')
 def model_class(request, db_engine):
     BaseModel = declarative_base(cls = Base, metadata = MetaData())
 
@@ -89,26 +89,10 @@ def test_configuration_sets(request,
     assert model_instance is not None
     assert isinstance(model_instance, model_class) is True
 
-    kwargs = {
-        'config_set': config_set
-    }
-
-    if format == 'dict':
-        method = model_instance.to_dict
-        expected_result = dict
-    elif format == 'json':
-        method = model_instance.to_json
-        expected_result = str
-        parse_function = parse_json
-    elif format == 'yaml':
-        method = model_instance.to_yaml
-        expected_result = str
-        parse_function = parse_yaml
-    elif format == 'csv':
-        method = model_instance.to_csv
-        expected_result = str
-        parse_function = parse_csv
-        kwargs['include_header'] = True
+    method_name, expected_result, parse_function, extra_kwargs = FORMAT_DISPATCH[format]
+    method = getattr(model_instance, method_name)
+
+    kwargs = dict(extra_kwargs, config_set = config_set)
 
     if not error:
         result = method(**kwargs)
@@ -120,8 +104,6 @@ def test_configuration_sets(request,
         assert result is not None
         assert isinstance(result, expected_result) is True
 
-        if format == 'csv':
-            result = result.split('\n')
         if format != 'dict':
             result = parse_function(result)
 
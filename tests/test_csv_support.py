@@ -11,14 +11,32 @@ Tests for CSV serialization/de-serialization support.
 
 import pytest
 
+from sqlalchemy import Integer, String
+
 from validator_collection import checkers
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_complex_postgresql, instance_postgresql, input_files, check_input_file
 
+from sqlathanor import declarative_base, Column
+from sqlathanor._compat import StringIO
 from sqlathanor.errors import CSVStructureError, DeserializationError
 from sqlathanor.utilities import get_attribute_names
 
+
+def _get_dumped_attribute_names(target):
+    """Return the non-special attribute names of ``target`` that are dumped to CSV.
+
+    Not cached per class: with ``include_nested = False`` the result depends on
+    the current attribute values of ``target``.
+    """
+    return [x for x in get_attribute_names(target,
+                                           include_callable = False,
+                                           include_nested = False,
+                                           include_private = True,
+                                           include_utilities = False)
+            if x[0:2] != '__']
+
 @pytest.mark.parametrize('deserialize, serialize, expected_length', [
     (None, True, 5),
     (True, None, 6),
@@ -53,16 +71,12 @@ def test_get_csv_column_names(request,
 
     print(column_positions)
 
-    smallint_column_sequence = None
-    hybrid_sequence = None
-    for index, column in enumerate(column_positions):
-        if column[0] == 'smallint_column':
-            smallint_column_sequence = column[2]
-        elif column[0] == 'hybrid':
-            hybrid_sequence = column[2]
+    assert all(previous[2] <= column[2]
+               for previous, column in zip(column_positions, column_positions[1:]))
 
-    if smallint_column_sequence is not None and hybrid_sequence is not None:
-        assert smallint_column_sequence < hybrid_sequence
+    sequences = dict((column[0], column[2]) for column in column_positions)
+    if 'smallint_column' in sequences and 'hybrid_value' in sequences:
+        assert sequences['smallint_column'] < sequences['hybrid_value']
 
 @pytest.mark.parametrize('delimiter, expected_result', [
     ('|', '_hybrid|addresses|hidden|hybrid|hybrid_differentiated|id|name|password|smallint_column|time_delta\r\n'),
@@ -74,12 +88,7 @@ def test__get_attribute_csv_header(request,
                                    delimiter,
                                    expected_result):
     target = instance_postgresql[0][0]
-    attributes = [x for x in get_attribute_names(target,
-                                                 include_callable = False,
-                                                 include_nested = False,
-                                                 include_private = True,
-                                                 include_utilities = False)
-                  if x[0:2] != '__']
+    attributes = _get_dumped_attribute_names(target)
 
     if delimiter is not None:
         result = target._get_attribute_csv_header(attributes,
@@ -128,20 +137,31 @@ def test_get_csv_header(request,
     ('|', True, '!', None, "1|!serialized!|2|!None!|86400.0\r\n"),
     ('|', False, "'", 'test|value', "1|serialized|2|'test|value'|86400.0\r\n"),
 ])
+@pytest.mark.parametrize('use_stream', [False, True])
 def test_get_csv_data(request,
                       instance_postgresql,
                       delimiter,
                       wrap_all_strings,
                       wrapper_character,
                       hybrid_value,
-                      expected_result):
+                      expected_result,
+                      use_stream):
     target = instance_postgresql[0][0]
 
     target.hybrid = hybrid_value
 
-    result = target.get_csv_data(delimiter = delimiter,
-                                 wrap_all_strings = wrap_all_strings,
-                                 wrapper_character = wrapper_character)
+    if use_stream:
+        stream = StringIO()
+        returned = target.get_csv_data(delimiter = delimiter,
+                                       wrap_all_strings = wrap_all_strings,
+                                       wrapper_character = wrapper_character,
+                                       stream = stream)
+        assert returned is None
+        result = stream.getvalue()
+    else:
+        result = target.get_csv_data(delimiter = delimiter,
+                                     wrap_all_strings = wrap_all_strings,
+                                     wrapper_character = wrapper_character)
 
     assert result == expected_result
 
@@ -165,12 +185,7 @@ def test__get_attribute_csv_data(request,
 
     target.hybrid = hybrid_value
 
-    attributes = [x for x in get_attribute_names(target,
-                                                 include_callable = False,
-                                                 include_nested = False,
-                                                 include_private = True,
-                                                 include_utilities = False)
-                  if x[0:2] != '__']
+    attributes = _get_dumped_attribute_names(target)
 
     result = target._get_attribute_csv_data(attributes,
                                             is_dumping = True,
@@ -199,6 +214,7 @@ def test__get_attribute_csv_data(request,
     (True, '|', False, "'", 'test|value', "id|name|smallint_column|hybrid_value|time_delta\r\n1|serialized|2|'test|value'|86400.0\r\n"),
 
 ])
+@pytest.mark.parametrize('use_stream', [False, True])
 def test_to_csv(request,
                 instance_postgresql,
                 include_header,
@@ -206,15 +222,57 @@ def test_to_csv(request,
                 wrap_all_strings,
                 wrapper_character,
                 hybrid_value,
-                expected_result):
+                expected_result,
+                use_stream):
     target = instance_postgresql[0][0]
 
     target.hybrid = hybrid_value
 
-    result = target.to_csv(include_header = include_header,
-                           delimiter = delimiter,
-                           wrap_all_strings = wrap_all_strings,
-                           wrapper_character = wrapper_character)
+    if use_stream:
+        stream = StringIO()
+        returned = target.to_csv(include_header = include_header,
+                                 delimiter = delimiter,
+                                 wrap_all_strings = wrap_all_strings,
+                                 wrapper_character = wrapper_character,
+                                 stream = stream)
+        assert returned is None
+        result = stream.getvalue()
+    else:
+        result = target.to_csv(include_header = include_header,
+                               delimiter = delimiter,
+                               wrap_all_strings = wrap_all_strings,
+                               wrapper_character = wrapper_character)
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize('include_header, use_stream', [
+    (False, False),
+    (True, False),
+    (False, True),
+    (True, True),
+])
+def test_to_csv_many(request,
+                     instance_postgresql,
+                     include_header,
+                     use_stream):
+    target = instance_postgresql[0][0]
+    target.hybrid = 1
+
+    expected_result = target.to_csv(include_header = include_header)
+    expected_result += target.to_csv(include_header = False)
+
+    model = target.__class__
+    if use_stream:
+        stream = StringIO()
+        returned = model.to_csv_many([target, target],
+                                     include_header = include_header,
+                                     stream = stream)
+        assert returned is None
+        result = stream.getvalue()
+    else:
+        result = model.to_csv_many([target, target],
+                                   include_header = include_header)
 
     assert result == expected_result
 
@@ -334,3 +392,28 @@ def test_new_from_csv(request,
     else:
         with pytest.raises(error):
             result = model.new_from_csv(input_value)
+
+
+def test_csv_column_names_cache_invalidation(request):
+    Base = declarative_base()
+
+    class CSVCacheTarget(Base):
+        __tablename__ = 'csv_cache_target'
+
+        id = Column('id',
+                    Integer,
+                    primary_key = True,
+                    supports_csv = True,
+                    csv_sequence = 1)
+        name = Column('name',
+                      String(50))
+
+    assert CSVCacheTarget.get_csv_column_names() == ['id']
+    assert CSVCacheTarget.get_csv_header() == 'id\r\n'
+
+    CSVCacheTarget.set_attribute_serialization_config('name',
+                                                      supports_csv = True,
+                                                      csv_sequence = 2)
+
+    assert CSVCacheTarget.get_csv_column_names() == ['id', 'name']
+    assert CSVCacheTarget.get_csv_header() == 'id|name\r\n'
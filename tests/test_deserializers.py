@@ -12,10 +12,12 @@ configuration data.
 
 import pytest
 import datetime
+from validator_collection.errors import CannotCoerceError
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_complex_postgresql, instance_postgresql
 
+from sqlathanor.default_deserializers import get_default_deserializer
 from sqlathanor.errors import InvalidFormatError, ValueDeserializationError, \
     UnsupportedDeserializationError
 
@@ -50,3 +52,19 @@ def test__get_deserialized_value(request,
     else:
         with pytest.raises(error):
             result = target._get_deserialized_value(input_value, format, attribute)
+
+
+@pytest.mark.parametrize('format, error', [
+    ('csv', None),
+    ('JSON', None),
+    ('invalid', InvalidFormatError),
+    (None, InvalidFormatError),
+    (['csv'], CannotCoerceError),
+])
+def test_get_default_deserializer_format(format, error):
+    if not error:
+        result = get_default_deserializer(None, format = format)
+        assert result is None
+    else:
+        with pytest.raises(error):
+            result = get_default_deserializer(None, format = format)
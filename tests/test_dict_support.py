@@ -15,7 +15,7 @@ import datetime
 
 from validator_collection import checkers
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, instance_single_pk, model_complex_postgresql, instance_postgresql
 
 from sqlathanor.errors import CSVStructureError, DeserializationError, \
@@ -27,6 +27,7 @@ from sqlathanor.utilities import are_dicts_equivalent
 
 @pytest.mark.parametrize('supports_serialization, hybrid_value, format, max_nesting, current_nesting, expected_result, warning, error', [
     (False, None, 'invalid', 0, 0, None, None, InvalidFormatError),
+    (False, None, ['csv'], 0, 0, None, None, InvalidFormatError),
     (False, None, 'dict', 0, 0, None, None, SerializableAttributeError),
     (False, None, 'json', 0, 0, None, None, SerializableAttributeError),
     (False, None, 'yaml', 0, 0, None, None, SerializableAttributeError),
@@ -114,6 +115,7 @@ def test__to_dict(request,
 
 @pytest.mark.parametrize('supports_serialization, hybrid_value, format, max_nesting, current_nesting, expected_result, extra_keys, error_on_extra_keys, drop_extra_keys, warning, error', [
     (False, None, 'invalid', 0, 0, None, None, True, False, None, InvalidFormatError),
+    (False, None, ['csv'], 0, 0, None, None, True, False, None, InvalidFormatError),
     (False, None, 'dict', 0, 0, None, None, True, False, None, (SerializableAttributeError, DeserializableAttributeError)),
     (False, None, 'json', 0, 0, None, None, True, False, None, (SerializableAttributeError, DeserializableAttributeError)),
     (False, None, 'yaml', 0, 0, None, None, True, False, None, (SerializableAttributeError, DeserializableAttributeError)),
@@ -249,6 +251,7 @@ def test_model__parse_dict(request,
 
 @pytest.mark.parametrize('supports_serialization, hybrid_value, format, max_nesting, current_nesting, expected_result, extra_keys, error_on_extra_keys, drop_extra_keys, warning, error', [
     (False, None, 'invalid', 0, 0, None, None, True, False, None, InvalidFormatError),
+    (False, None, ['csv'], 0, 0, None, None, True, False, None, InvalidFormatError),
     (False, None, 'dict', 0, 0, None, None, True, False, None, (SerializableAttributeError, DeserializableAttributeError)),
     (False, None, 'json', 0, 0, None, None, True, False, None, (SerializableAttributeError, DeserializableAttributeError)),
     (False, None, 'yaml', 0, 0, None, None, True, False, None, (SerializableAttributeError, DeserializableAttributeError)),
@@ -12,7 +12,7 @@ Tests for how SQLAthanor deserializes Interval columns.
 import pytest
 import datetime
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_complex_postgresql, instance_postgresql
 
 from sqlathanor.errors import InvalidFormatError, ValueDeserializationError, \
@@ -16,7 +16,7 @@ import datetime
 import simplejson
 from validator_collection import checkers
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, instance_single_pk, model_complex_postgresql, instance_postgresql,\
     input_files, check_input_file, model_nested_one_to_one, instance_nested_one_to_one
 
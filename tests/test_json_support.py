@@ -16,7 +16,7 @@ import datetime
 import simplejson
 from validator_collection import checkers
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, instance_single_pk, model_complex_postgresql, instance_postgresql,\
     input_files, check_input_file
 
@@ -134,6 +134,29 @@ def test_to_json(request,
         assert are_dicts_equivalent(interim_dict, deserialized_dict) is True
 
 
+@pytest.mark.parametrize('serialize_function', [
+    None,
+    simplejson.dumps,
+])
+def test_to_json_many(request,
+                      instance_postgresql,
+                      serialize_function):
+    target = instance_postgresql[0][0]
+    target.hybrid = 1
+
+    interim_dict = target._to_dict('json')
+
+    result = target.__class__.to_json_many([target, target],
+                                           serialize_function = serialize_function)
+    assert isinstance(result, str)
+
+    deserialized = json.loads(result)
+    assert isinstance(deserialized, list)
+    assert len(deserialized) == 2
+    for item in deserialized:
+        assert are_dicts_equivalent(interim_dict, item) is True
+
+
 @pytest.mark.parametrize('supports_serialization, hybrid_value, max_nesting, current_nesting, serialize_function, warning, error', [
     (False, None, 0, 0, None, MaximumNestingExceededWarning, None),
 
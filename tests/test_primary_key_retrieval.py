@@ -13,7 +13,7 @@ import pytest
 
 from sqlathanor import Column
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, model_composite_pk, instance_single_pk, instance_composite_pk
 
 
@@ -16,7 +16,7 @@ import pytest
 from sqlathanor import Column
 from sqlathanor.errors import UnsupportedSerializationError
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_reflected_tables, instance_complex
 
 @pytest.mark.parametrize('test_index, expected_result, column_names', [
@@ -15,12 +15,18 @@ import pytest
 
 from sqlathanor import declarative_base, Column, relationship
 
-from sqlalchemy import create_engine, Integer, String, Sequence, ForeignKey
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Integer, String, Sequence, ForeignKey
+
+from tests.fixtures import relationship_engine, relationship_session
 
 Base = declarative_base()
 
 
+@pytest.fixture(scope = 'module')
+def relationship_base(request):
+    return Base
+
+
 class User(Base):
     __tablename__ = 'users'
 
@@ -102,13 +108,7 @@ def json_fails():
     (False),
     (True),
 ])
-def test_relationship_new_from_json(json_passes, json_fails, use_fails):
-    engine = create_engine('sqlite:///')
-    Base.metadata.create_all(engine)
-
-    Session = sessionmaker(bind = engine)
-    session = Session()
-
+def test_relationship_new_from_json(relationship_session, json_passes, json_fails, use_fails):
     if use_fails:
         input = json_fails
     else:
@@ -15,12 +15,18 @@ import pytest
 
 from sqlathanor import declarative_base, Column, relationship
 
-from sqlalchemy import create_engine, Integer, String, Sequence, ForeignKey
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Integer, String, Sequence, ForeignKey
+
+from tests.fixtures import relationship_engine, relationship_session
 
 Base = declarative_base()
 
 
+@pytest.fixture(scope = 'module')
+def relationship_base(request):
+    return Base
+
+
 def serialize_address(input):
     raise RuntimeError('error was raised successfully!')
 
@@ -80,18 +86,12 @@ class Address(Base):
     (2, RuntimeError),
     (0, RuntimeError),
 ])
-def test_relationship_on_serialize(max_nesting, error):
-    engine = create_engine('sqlite:///')
-    Base.metadata.create_all(engine)
-
-    Session = sessionmaker(bind = engine)
-    session = Session()
-
+def test_relationship_on_serialize(relationship_session, max_nesting, error):
     scott = User(name='scott')
     scott.addresses = [Address(email='scott@example.com'),
                        Address(email='scott@example.org')]
-    session.add(scott)
-    session.commit()
+    relationship_session.add(scott)
+    relationship_session.commit()
 
     if not error:
         result = scott.to_dict(max_nesting = max_nesting)
@@ -18,10 +18,11 @@ from sqlathanor import Column
 from sqlathanor.attributes import BLANK_ON_SERIALIZE, AttributeConfiguration
 from sqlathanor.errors import UnsupportedSerializationError
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, model_composite_pk, instance_single_pk, instance_composite_pk, \
     model_complex, model_complex_meta, instance_complex, instance_complex_meta, \
-    original_hybrid_config, original_config_set, new_config_set, new_argument_set
+    original_hybrid_config, original_config_set, new_config_set, new_argument_set, \
+    model_complex_postgresql
 
 def test_func():
     pass
@@ -55,7 +56,7 @@ def test_instance__serialization__(request,
 @pytest.mark.parametrize('test_index, include_private, exclude_methods, expected_length', [
     (0, False, True, 10),
     (0, True, True, 13),
-    (0, False, False, 41),
+    (0, False, False, 43),
 ])
 def test_model__get_instance_attributes(request,
                                         model_complex_meta,
@@ -524,6 +525,27 @@ def test_model_get_attribute_serialization_config(request,
     assert (result is not None) is returns_value
 
 
+@pytest.mark.parametrize('attribute, expected_name', [
+    ('hybrid', 'hybrid'),
+    ('hybrid_value', 'hybrid'),
+    ('password', 'password'),
+    ('missing-attribute', None),
+])
+def test_model_get_attribute_serialization_config_display_name(request,
+                                                               model_complex_postgresql,
+                                                               attribute,
+                                                               expected_name):
+    target = model_complex_postgresql[0]
+
+    result = target.get_attribute_serialization_config(attribute)
+
+    if expected_name is None:
+        assert result is None
+    else:
+        assert result.name == expected_name
+        assert result is not target.get_attribute_serialization_config(attribute)
+
+
 @pytest.mark.parametrize('use_meta, test_index, attribute, format_support, returns_value, fails', [
     (False, 0, 'id', {
         'from_csv': None,
@@ -1096,7 +1118,7 @@ def test_model_set_attribute_serialization_config(request,
 @pytest.mark.parametrize('test_index, include_private, exclude_methods, expected_length', [
     (0, False, True, 10),
     (0, True, True, 13),
-    (0, False, False, 41),
+    (0, False, False, 43),
 ])
 def test_instance__get_instance_attributes(request,
                                            instance_complex_meta,
@@ -9,11 +9,15 @@ Tests for :term:`serializer functions <serializer function>`.
 
 """
 
+import datetime
+
 import pytest
+from validator_collection.errors import CannotCoerceError
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_complex_postgresql, instance_postgresql
 
+from sqlathanor.default_serializers import get_default_serializer
 from sqlathanor.errors import InvalidFormatError, ValueSerializationError, \
     UnsupportedSerializationError
 
@@ -45,3 +49,19 @@ def test__get_serialized_value(request,
     else:
         with pytest.raises(error):
             result = target._get_serialized_value(format, attribute)
+
+
+@pytest.mark.parametrize('format, error', [
+    ('csv', None),
+    ('JSON', None),
+    ('invalid', InvalidFormatError),
+    (None, InvalidFormatError),
+    (['csv'], CannotCoerceError),
+])
+def test_get_default_serializer_format(format, error):
+    if not error:
+        result = get_default_serializer(None, format = format, value = datetime.date(2020, 1, 1))
+        assert result is not None
+    else:
+        with pytest.raises(error):
+            result = get_default_serializer(None, format = format, value = datetime.date(2020, 1, 1))
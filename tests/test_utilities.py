@@ -8,21 +8,29 @@ tests.test_utilities
 Tests for the schema extensions written in :ref:`sqlathanor.utilities`.
 
 """
+import csv
+import datetime
+import json
 import os
+import sys
+from decimal import Decimal
 
 import pytest
 import sqlalchemy
+import yaml
 
 from validator_collection import checkers
-from validator_collection.errors import NotAnIterableError
+from validator_collection.errors import NotAnIterableError, CannotCoerceError
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_complex_postgresql, instance_postgresql, input_files, check_input_file
 
+from sqlathanor import utilities, declarative_base, Column
 from sqlathanor.utilities import bool_to_tuple, callable_to_dict, format_to_tuple, \
     get_class_type_key, raise_UnsupportedSerializationError, \
     raise_UnsupportedDeserializationError, iterable__to_dict, parse_yaml, parse_json, \
-    get_attribute_names, is_an_attribute, parse_csv, read_csv_data
+    get_attribute_names, is_an_attribute, parse_csv, read_csv_data, are_equivalent, \
+    are_dicts_equivalent, get_csv_format_params, yaml_dump, _YamlDumper
 from sqlathanor.errors import InvalidFormatError, UnsupportedSerializationError, \
     UnsupportedDeserializationError, MaximumNestingExceededError, \
     MaximumNestingExceededWarning, DeserializationError, CSVStructureError
@@ -87,21 +95,44 @@ def test_callable_to_dict(value):
             assert result[key] == value
 
 
-@pytest.mark.parametrize('value, expected_result, fails', [
-    ('csv', (True, None, None, None), False),
-    ('json', (None, True, None, None), False),
-    ('yaml', (None, None, True, None), False),
-    ('dict', (None, None, None, True), False),
-    ('invalid', None, True)
+def test_callable_to_dict_does_not_mutate_input():
+    value = {
+        'json': sample_callable
+    }
+
+    result = callable_to_dict(value)
+
+    assert result is not value
+    assert value == {'json': sample_callable}
+    assert result == {
+        'csv': None,
+        'json': sample_callable,
+        'yaml': None,
+        'dict': None
+    }
+    assert callable_to_dict(None) is not callable_to_dict(None)
+
+
+@pytest.mark.parametrize('value, expected_result, error', [
+    ('csv', (True, None, None, None), None),
+    ('json', (None, True, None, None), None),
+    ('yaml', (None, None, True, None), None),
+    ('dict', (None, None, None, True), None),
+    ('JSON', (None, True, None, None), None),
+    ('invalid', None, InvalidFormatError),
+    ('', None, InvalidFormatError),
+    (None, None, InvalidFormatError),
+    (123, None, CannotCoerceError),
+    (['csv'], None, CannotCoerceError),
 ])
 def test_format_to_tuple(value,
                          expected_result,
-                         fails):
-    if not fails:
+                         error):
+    if not error:
         result = format_to_tuple(value)
         assert result == expected_result
     else:
-        with pytest.raises(InvalidFormatError):
+        with pytest.raises(error):
             result = format_to_tuple(value)
 
 
@@ -109,6 +140,12 @@ def test_format_to_tuple(value,
     (None, None, 'NONE'),
     (None, 1, 'int'),
     (None, 'string', 'str'),
+    (None, 1.5, 'float'),
+    (None, True, 'bool'),
+    (None, Decimal('1.5'), 'Decimal'),
+    (None, datetime.date(2018, 1, 1), 'date'),
+    (None, datetime.datetime(2018, 1, 1), 'datetime'),
+    (None, {'key': 'value'}, 'dict'),
 
     ('id', 1, 'INTEGER'),
     ('smallint_column', 2, 'SMALLINT'),
@@ -128,6 +165,19 @@ def test_get_class_type_key(request,
     assert result == expected_result
 
 
+def test_get_class_type_key_untyped_attribute():
+    class UntypedAttribute(object):
+        def __eq__(self, other):
+            raise AssertionError('attributes must be compared by identity')
+
+        __hash__ = object.__hash__
+
+    attribute = UntypedAttribute()
+    assert get_class_type_key(attribute, value = 1) == 'int'
+    assert get_class_type_key(attribute, value = 'test') == 'str'
+    assert get_class_type_key(attribute) == 'NONE'
+
+
 def test_raise_UnsupportedSerializationError():
     with pytest.raises(UnsupportedSerializationError):
         raise_UnsupportedSerializationError('test')
@@ -138,6 +188,11 @@ def test_raise_UnsupportedDeserializationError():
         raise_UnsupportedDeserializationError('test')
 
 
+class DummyIterable(object):
+    def __iter__(self):
+        return iter([1, 2])
+
+
 class DummyClass(object):
     def __init__(self, *args, **kwargs):
         pass
@@ -157,6 +212,7 @@ class DummyClass(object):
 
 @pytest.mark.parametrize('input_value, format, max_nesting, current_nesting, expected_result, warning, error', [
     ([], 'invalid-format', 0, 0, None, None, InvalidFormatError),
+    ([1], ['csv'], 0, 0, None, None, InvalidFormatError),
     (123, 'dict', 0, 0, None, None, NotAnIterableError),
     ([1, 2, 3], 'dict', 0, 3, None, None, MaximumNestingExceededError),
 
@@ -165,6 +221,11 @@ class DummyClass(object):
     ([1, 2, 3], 'yaml', 0, 0, [1, 2, 3], None, None),
     ([1, 2, 3], 'csv', 0, 0, [1, 2, 3], None, None),
 
+    ([1, (2, 3), 'four'], 'dict', 1, 0, [1, [2, 3], 'four'], None, None),
+    ([1, (2, 3), 'four'], 'dict', 0, 0, None, None, MaximumNestingExceededError),
+    ([DummyIterable], 'dict', 0, 0, [DummyIterable], None, None),
+    ([DummyIterable()], 'dict', 1, 0, [[1, 2]], None, None),
+
     ([{
         'test': 'one',
         'test2': 'two'
@@ -181,6 +242,11 @@ class DummyClass(object):
         'test': 'nested-one',
         'test2': 'nested-two'
     }], None, MaximumNestingExceededError),
+    ([DummyClass(), 2], 'dict', 1, 0, [{
+        'test': 'nested-one',
+        'test2': 'nested-two'
+    }, 2], None, None),
+    ([1, 'two', (3, 4)], 'dict', 1, 0, [1, 'two', [3, 4]], None, None),
 
 ])
 def test_iterable__to_dict(input_value,
@@ -208,8 +274,101 @@ def test_iterable__to_dict(input_value,
                                        current_nesting = current_nesting)
 
 
+def test_iterable__to_dict_deep_nesting():
+    depth = sys.getrecursionlimit() * 2
+    input_value = []
+    current = input_value
+    for _ in range(depth):
+        child = []
+        current.append(child)
+        current = child
+
+    result = iterable__to_dict(input_value,
+                               'dict',
+                               max_nesting = depth)
+
+    nesting = 0
+    while result:
+        result = result[0]
+        nesting += 1
+
+    assert nesting == depth
+
+
+@pytest.mark.parametrize('dtype, expected_type', [
+    ('bool', bool),
+    ('int64', int),
+    ('uint8', int),
+    ('float64', float),
+])
+def test_iterable__to_dict_numpy(dtype, expected_type):
+    numpy = pytest.importorskip('numpy')
+
+    input_value = [numpy.array([1, 0, 1], dtype = dtype)]
+
+    result = iterable__to_dict(input_value, 'dict', max_nesting = 1)
+
+    assert result == [[1, 0, 1]]
+    for item in result[0]:
+        assert type(item) is expected_type
+
+
+SHARED_LIST = [1, 2, 3]
+
+@pytest.mark.parametrize('args, expected_result', [
+    ((1, ), True),
+    ((1, 1), True),
+    ((1, 1, 1), True),
+    ((1, 2), False),
+    ((1, 1.0), False),
+    (('test', 'test'), True),
+    (('test', 'other'), False),
+    ((None, None), True),
+    ((SHARED_LIST, SHARED_LIST), True),
+    (([1, 2, 3], [1, 2, 3]), True),
+    (([1, 2, 3], [3, 2, 1]), True),
+    (({1, 2, 3}, {3, 2, 1}), True),
+    (({1, 2, 3}, {1, 2, 4}), False),
+    ((frozenset([1, 2]), {1, 2}), False),
+    (([1, 2, 3], [1, 2]), False),
+    (([1, 2, 3], [1, 2, 4]), False),
+    (([1, 1, 2], [1, 2, 2]), False),
+    (([{'a': 1}, {'b': 2}], [{'b': 2}, {'a': 1}]), True),
+    (([{'a': 1}, {'a': 1}], [{'a': 1}, {'b': 2}]), False),
+    (([{'a': 1}, {'b': 2}], [{'a': 1}, {'b': 2}]), True),
+    (([{'a': 1}, {'b': 2}, {'c': 3}], [{'a': 1}, {'c': 3}, {'b': 2}]), True),
+    (([{'a': 1}, {'b': 2}, {'c': 3}], [{'a': 1}, {'c': 3}, {'c': 3}]), False),
+    (((1, 2), (2, 1)), True),
+    (((1, 2), [1, 2]), False),
+    (({'a': 1, 'b': [1, 2]}, {'b': [2, 1], 'a': 1}), True),
+    (({'a': 1}, {'a': 2}), False),
+    (({'a': 1}, {'b': 1}), False),
+])
+def test_are_equivalent(args, expected_result):
+    assert are_equivalent(*args) is expected_result
+
+
+@pytest.mark.parametrize('args, expected_result', [
+    ((), False),
+    (({'a': 1}, ), True),
+    (({'a': 1}, {'a': 1}), True),
+    (({'a': 1}, {'a': 1, 'b': 2}), False),
+    (({'a': {'b': [1, 2]}}, {'a': {'b': [2, 1]}}), True),
+    (({'a': {'b': [1, 2]}}, {'a': {'b': [1, 3]}}), False),
+    (({'a': 1}, {'a': 1.0}), False),
+    (({'a': 1}, {'a': True}), False),
+    (({'a': [1, 2]}, {'a': [2, 1]}), True),
+    (({'a': 'x', 'b': None}, {'b': None, 'a': 'x'}), True),
+    (({'a': 1}, [1]), False),
+    (('{"a": 1}', '{"a": 1}'), False),
+])
+def test_are_dicts_equivalent(args, expected_result):
+    assert are_dicts_equivalent(*args) is expected_result
+
+
 @pytest.mark.parametrize('input_value, deserialize_function, expected_result, error', [
     ('{"test": 123, "second_test": "this is a test"}', None, { 'test': 123, 'second_test': 'this is a test' }, None),
+    ('{"test": 123456789012345678901234567890}', None, { 'test': 123456789012345678901234567890 }, None),
 
     (None, None, None, DeserializationError),
     (None, 'not-callable', None, ValueError),
@@ -236,6 +395,37 @@ def test_parse_json(input_files,
             result = parse_json(input_value)
 
 
+class StrictOrjson(object):
+    """Stand-in for an ``orjson`` which raises on integers wider than 64 bits."""
+    class JSONDecodeError(ValueError):
+        pass
+
+    calls = 0
+
+    @classmethod
+    def loads(cls, input_data):
+        cls.calls += 1
+        if '123456789012345678901234567890' in input_data:
+            raise cls.JSONDecodeError('integer exceeds 64-bit range')
+
+        return json.loads(input_data)
+
+
+@pytest.mark.parametrize('input_value, expected_result', [
+    ('{"test": 123456789012345678901234567890}', { 'test': 123456789012345678901234567890 }),
+    ('{"test": "123456789012345678901"}', { 'test': '123456789012345678901' }),
+])
+def test_parse_json_orjson_overflow(monkeypatch, input_value, expected_result):
+    monkeypatch.setattr(utilities, 'orjson', StrictOrjson)
+    monkeypatch.setattr(utilities, '_LONG_DIGIT_RUN', None)
+    StrictOrjson.calls = 0
+
+    result = parse_json(input_value)
+
+    assert result == expected_result
+    assert StrictOrjson.calls == 1
+
+
 @pytest.mark.parametrize('input_value, deserialize_function, expected_result, error', [
     ('{"test": 123, "second_test": "this is a test"}', None, { 'test': 123, 'second_test': 'this is a test' }, None),
 
@@ -265,11 +455,73 @@ def test_parse_yaml(input_files,
             result = parse_yaml(input_value)
 
 
+@pytest.mark.parametrize('value', [
+    ({ 'id': 1, 'name': 'serialized', 'hybrid': None, 'time_delta': 86400.0 }),
+    ({ 'id': 1, 'is_active': True, '_hidden': False, 'parent_id': None }),
+    ({ 'yes': 1, 'null': None, 'Off': True }),
+    ({ 'k' * 61: 1, 'two words': 2, '1st': 3 }),
+    ({ 'flag': True, 'other_flag': False, 'big': 1e20, 'small': -0.0 }),
+    ({ 'text': 'a plain string', 'dotted': 'a.b-c_d' }),
+    ({ 'keyword': 'yes', 'null_text': 'null', 'number_text': '1.0' }),
+    ({ 'date_text': '2020-01-01', 'time_text': '12:30', 'octal_text': '012' }),
+    ({ 'special': 'test|value', 'quote': "it's", 'empty': '' }),
+    ({ 'long': 'x' * 100, 'spaced': 'a  b', 'nan': float('nan') }),
+    ({ 1: 'non-string key' }),
+    ({ 1: 'a', 'b': 2 }),
+    ({ 'nested': { 'test': 123 } }),
+    ({}),
+    ([1, 2, 3]),
+])
+def test_yaml_dump(value):
+    expected_result = yaml.dump(value, Dumper = _YamlDumper)
+    result = yaml_dump(value)
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize('value, c_result, python_result', [
+    ({ '': 1 }, "'': 1\n", "? ''\n: 1\n"),
+])
+def test_yaml_dump_libyaml_differences(value, c_result, python_result):
+    result = yaml_dump(value)
+
+    if _YamlDumper is yaml.Dumper:
+        assert result == python_result
+    else:
+        assert result == c_result
+        assert yaml.dump(value, Dumper = yaml.Dumper) == python_result
+
+    assert yaml.safe_load(result) == value
+
+
+@pytest.mark.parametrize('parser', [
+    (parse_json),
+    (parse_yaml),
+])
+def test_parse_custom_deserialize_function(parser):
+    calls = []
+
+    def deserialize_function(value, **kwargs):
+        calls.append((value, kwargs))
+        return {'test': 'custom'}
+
+    result = parser('{"test": 123}',
+                    deserialize_function = deserialize_function,
+                    option = True)
+
+    assert result == {'test': 'custom'}
+    assert calls == [('{"test": 123}', {'option': True})]
+
+
 @pytest.mark.parametrize('input_value, kwargs, expected_result, error', [
     (["col1|col2|col3", "123|456|789"], None, {'col1': '123', 'col2': '456', 'col3': '789'}, None),
     (["col1|col2|col3"], None, None, CSVStructureError),
     (["col1|col2|col3", "123|456|789", "987|654|321"], None, {'col1': '123', 'col2': '456', 'col3': '789'}, None),
     (["not a variable name|col2|col3", "123|456|789"], None, None, CSVStructureError),
+    ("col1|col2|col3\r\n123|456|789\r\n", None, {'col1': '123', 'col2': '456', 'col3': '789'}, None),
+    ("col1|col2|col3\n123|456|789\n987|654|321\n", None, {'col1': '123', 'col2': '456', 'col3': '789'}, None),
+    ("col1|col2|col3\r\n", None, None, CSVStructureError),
+    ("col1;col2\r\n'1;2';None\r\n", {'delimiter': ';'}, {'col1': '1;2', 'col2': None}, None),
 ])
 def test_parse_csv(input_value, kwargs, expected_result, error):
     if not error:
@@ -290,6 +542,33 @@ def test_parse_csv(input_value, kwargs, expected_result, error):
                 result = parse_csv(input_value)
 
 
+@pytest.mark.parametrize('wrap_all_strings, wrapper_character, expected_quoting, expected_quotechar', [
+    (False, "'", csv.QUOTE_MINIMAL, "'"),
+    (True, "'", csv.QUOTE_NONNUMERIC, "'"),
+    (False, '"', csv.QUOTE_MINIMAL, '"'),
+    (False, None, csv.QUOTE_MINIMAL, "'"),
+])
+def test_get_csv_format_params(wrap_all_strings,
+                               wrapper_character,
+                               expected_quoting,
+                               expected_quotechar):
+    result = get_csv_format_params('|',
+                                   wrap_all_strings,
+                                   wrapper_character,
+                                   False,
+                                   '\\',
+                                   '\r\n')
+
+    assert result == {
+        'delimiter': '|',
+        'doublequote': False,
+        'escapechar': '\\',
+        'quotechar': expected_quotechar,
+        'quoting': expected_quoting,
+        'lineterminator': '\r\n'
+    }
+
+
 @pytest.mark.parametrize('use_instance, include_callable, include_nested, include_private, include_special, include_utilities, expected_result', [
     (False, False, False, False, False, False, 8),
     (False, False, False, False, False, True, 10),
@@ -298,10 +577,10 @@ def test_parse_csv(input_value, kwargs, expected_result, error):
     (False, False, True, False, False, False, 10),
     (False, False, True, True, False, False, 11),
     (False, False, True, True, False, True, 15),
-    (False, True, False, False, False, False, 39),
-    (False, True, True, False, False, False, 41),
-    (False, True, True, True, False, False, 57),
-    (False, True, True, True, False, True, 61),
+    (False, True, False, False, False, False, 41),
+    (False, True, True, False, False, False, 43),
+    (False, True, True, True, False, False, 59),
+    (False, True, True, True, False, True, 63),
 
     (True, False, False, False, False, False, 9),
     (True, False, False, False, False, True, 11),
@@ -310,10 +589,10 @@ def test_parse_csv(input_value, kwargs, expected_result, error):
     (True, False, True, False, False, False, 10),
     (True, False, True, True, False, False, 11),
     (True, False, True, True, False, True, (15, 16)),
-    (True, True, False, False, False, False, 40),
-    (True, True, True, False, False, False, 41),
-    (True, True, True, True, False, False, 57),
-    (True, True, True, True, False, True, 62),
+    (True, True, False, False, False, False, 42),
+    (True, True, True, False, False, False, 43),
+    (True, True, True, True, False, False, 59),
+    (True, True, True, True, False, True, 64),
 
 ])
 def test_get_attribute_names(model_complex_postgresql,
@@ -345,6 +624,119 @@ def test_get_attribute_names(model_complex_postgresql,
     assert len(result) == expected_result
 
 
+@pytest.mark.parametrize('use_instance', [
+    (False),
+    (True),
+])
+def test_get_attribute_names_cache(use_instance):
+    class TestClass(object):
+        int_attribute = 1
+
+        def __init__(self, *args, **kwargs):
+            self.instance_attribute = 'test'
+
+    target = TestClass() if use_instance else TestClass
+
+    result = get_attribute_names(target)
+    assert 'int_attribute' in result
+    assert ('instance_attribute' in result) is use_instance
+    assert 'added_attribute' not in result
+
+    TestClass.added_attribute = 'test'
+
+    result = get_attribute_names(target)
+    assert 'added_attribute' in result
+    assert result == sorted(result)
+
+
+@pytest.mark.parametrize('use_instance', [
+    (False),
+    (True),
+])
+def test_get_attribute_names_cache_rebound(use_instance):
+    class TestClass(object):
+        rebound_attribute = 1
+
+        def rebound_method(self):
+            pass
+
+    target = TestClass() if use_instance else TestClass
+
+    result = get_attribute_names(target)
+    assert 'rebound_attribute' in result
+    assert 'rebound_method' not in result
+
+    TestClass.rebound_attribute = lambda self: None
+    TestClass.rebound_method = 'test'
+
+    result = get_attribute_names(target)
+    assert 'rebound_attribute' not in result
+    assert 'rebound_method' in result
+
+
+@pytest.mark.parametrize('use_instance', [
+    (False),
+    (True),
+])
+def test_get_attribute_names_cache_declarative(use_instance):
+    TestBase = declarative_base()
+
+    class TestModel(TestBase):
+        __tablename__ = 'test_attribute_names_cache'
+
+        id = Column('id', sqlalchemy.Integer, primary_key = True)
+        rebound_attribute = 1
+
+    target = TestModel() if use_instance else TestModel
+
+    result = get_attribute_names(target)
+    assert 'rebound_attribute' in result
+    assert 'added_attribute' not in result
+
+    TestBase.added_attribute = 'test'
+    TestModel.rebound_attribute = lambda self: None
+
+    result = get_attribute_names(target)
+    assert 'added_attribute' in result
+    assert 'rebound_attribute' not in result
+    assert is_an_attribute(target, 'rebound_attribute') is False
+
+    del TestBase.added_attribute
+
+    assert 'added_attribute' not in get_attribute_names(target)
+    assert is_an_attribute(target, 'added_attribute') is False
+
+
+def test_get_attribute_names_shadowed_method():
+    class TestClass(object):
+        def method(self):
+            pass
+
+        @classmethod
+        def class_method(cls):
+            pass
+
+        @staticmethod
+        def static_method():
+            pass
+
+    target = TestClass()
+    result = get_attribute_names(target)
+    assert 'method' not in result
+    assert 'class_method' not in result
+    assert 'static_method' not in result
+
+    result = get_attribute_names(target, include_callable = True)
+    assert 'method' in result
+    assert 'class_method' in result
+    assert 'static_method' in result
+
+    target.method = 'test'
+    assert 'method' in get_attribute_names(target)
+    assert is_an_attribute(target, 'method') is True
+    assert is_an_attribute(target, 'class_method') is False
+
+
 @pytest.mark.parametrize('use_instance, attribute, forbid_callable, forbid_nested, expected_result', [
     (False, 'boolean_attribute', False, False, True),
     (False, 'string_attribute', False, False, True),
@@ -377,6 +769,12 @@ def test_get_attribute_names(model_complex_postgresql,
     (True, 'property_attribute', True, False, True),
     (True, 'method_attribute', False, False, True),
     (True, 'method_attribute', True, False, False),
+    (True, 'broken_property', False, False, False),
+    (True, 'missing_attribute', False, False, False),
+    (True, '_private_attribute', False, False, False),
+    (True, '__init__', False, False, False),
+    (True, '', False, False, False),
+    (True, None, False, False, False),
 ])
 def test_is_an_attribute(use_instance, attribute, forbid_callable, forbid_nested, expected_result):
     class TestClass(object):
@@ -391,12 +789,16 @@ def test_is_an_attribute(use_instance, attribute, forbid_callable, forbid_nested
         set_int = set([1, 2, 3])
 
         def __init__(self, *args, **kwargs):
-            pass
+            self._private_attribute = 1
 
         @property
         def property_attribute(self):
             pass
 
+        @property
+        def broken_property(self):
+            raise AttributeError('broken')
+
         def method_attribute(self, value):
             pass
 
@@ -416,6 +818,8 @@ def test_is_an_attribute(use_instance, attribute, forbid_callable, forbid_nested
     ("col1|col2|col3\n123|456|789", True, '123|456|789'),
     ("col1|col2|col3\r123|456|789", True, '123|456|789'),
     ("col1|col2|col3", True, "col1|col2|col3"),
+    ("col1|col2|col3\r\n\r\n123|456|789", True, ''),
+    ("col1|col2|col3\n123|456|789\n987|654|321", True, '123|456|789'),
 
     ("CSV/input_csv1.csv", True, '123|456|789'),
     ("CSV/input_csv2.csv", True, 'col1|col2|col3'),
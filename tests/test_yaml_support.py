@@ -21,7 +21,7 @@ from yaml.constructor import ConstructorError
 
 from validator_collection import checkers
 
-from tests.fixtures import db_engine, tables, base_model, db_session, \
+from tests.fixtures import db_engine, db_connection, tables, base_model, db_session, \
     model_single_pk, instance_single_pk, model_complex_postgresql, instance_postgresql,\
     input_files, check_input_file
 